@@ -171,11 +171,153 @@ temperatures = [23, 20, 25, 22, 26]
 
 # 2.	Return Multiple Values from Functions:
 # o	Use lists to return multiple values from functions.
+# RunningStats reads the numbers one at a time, so it works on any iterable or generator
+# and never needs a sorted copy of the data:
+# o	count, mean and variance are updated with Welford's algorithm (numerically stable, O(1) memory).
+# o	min and max are tracked as the numbers go by.
+# o	the exact median is kept with two heaps: a max-heap of the lower half (stored negated,
+#   since heapq only has min-heaps) and a min-heap of the upper half.
+# calculate_statistics uses it for iterators and generators; lists and tuples are already in
+# memory, so they keep the faster sorted() version.
+import heapq
+
+class RunningStats:
+    def __init__(self, numbers=(), track_median=True):
+        self.count = 0
+        self._mean = 0.0
+        self._m2 = 0.0  # Sum of squared differences from the mean
+        self.min = None
+        self.max = None
+        self.track_median = track_median
+        self._lower = []  # Max-heap (negated) holding the smallest count // 2 numbers
+        self._upper = []  # Min-heap holding the rest
+        self.update(numbers)
+
+    def add(self, x):
+        self.count += 1
+        delta = x - self._mean
+        self._mean += delta / self.count
+        self._m2 += delta * (x - self._mean)
+        if self.min is None or x < self.min:
+            self.min = x
+        if self.max is None or x > self.max:
+            self.max = x
+        if self.track_median:
+            if self._lower and x < -self._lower[0]:
+                heapq.heappush(self._lower, -x)
+            else:
+                heapq.heappush(self._upper, x)
+            # Rebalance so that len(lower) == count // 2 always holds
+            if len(self._lower) > self.count // 2:
+                heapq.heappush(self._upper, -heapq.heappop(self._lower))
+            elif len(self._lower) < self.count // 2:
+                heapq.heappush(self._lower, -heapq.heappop(self._upper))
+
+    def update(self, numbers):
+        for x in numbers:
+            self.add(x)
+
+    @property
+    def mean(self):
+        if not self.count:
+            raise ValueError("mean requires at least one number")
+        return self._mean
+
+    @property
+    def pvariance(self):
+        # Population variance
+        if not self.count:
+            raise ValueError("variance requires at least one number")
+        return self._m2 / self.count
+
+    @property
+    def variance(self):
+        # Sample variance, like statistics.variance()
+        if self.count < 2:
+            raise ValueError("sample variance requires at least two numbers")
+        return self._m2 / (self.count - 1)
+
+    @property
+    def median(self):
+        # Same element as sorted(numbers)[len(numbers) // 2]
+        if not self.track_median:
+            raise ValueError("median is only available with track_median=True")
+        if not self.count:
+            raise ValueError("median requires at least one number")
+        return self._upper[0]
+
+# Typed numeric buffers (array.array, memoryview, bytes, NumPy arrays) take a vectorised
+# NumPy path when NumPy is installed: mean in one call and the median with np.partition,
+# which only places the middle element instead of sorting everything.
+# Without NumPy they have a length like lists do, so they take the same sum()/sorted() path.
+import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+def as_numpy_array(numbers):
+    # Returns a NumPy view of a typed buffer, or None to use the pure Python path
+    if np is None:
+        return None
+    if isinstance(numbers, np.ndarray):
+        return numbers
+    if isinstance(numbers, (bytes, bytearray)):
+        return np.frombuffer(numbers, dtype=np.uint8)
+    if isinstance(numbers, (array.array, memoryview)):
+        return np.asarray(numbers)
+    return None
+
 def calculate_statistics(numbers):
+    values = as_numpy_array(numbers)
+    if values is not None and values.size:
+        middle = values.size // 2
+        return [values.mean().item(), np.partition(values, middle)[middle].item()]
+    if hasattr(numbers, "__len__"):
+        # Already in memory (list, tuple, ...): sorted() runs in C and beats the two heaps
+        if len(numbers) == 0:
+            raise ValueError("mean requires at least one number")
+        return [sum(numbers) / len(numbers), sorted(numbers)[len(numbers) // 2]]
+    stats = RunningStats(numbers)  # Iterators and generators are read once, without a list
+    return [stats.mean, stats.median]
+stats = calculate_statistics([1, 2, 3, 4, 5])
+stats = calculate_statistics(x * 0.5 for x in range(10))  # Generators work too
+stats = calculate_statistics(array.array('d', [1.0, 2.0, 3.0, 4.0, 5.0]))  # Typed arrays use NumPy if installed
+
+# Benchmark: the old sort-based version against calculate_statistics on a list (same sorted() path)
+# and on a generator (RunningStats). RunningStats is slower, but it never builds a list of the
+# stream; with track_median=False its memory stays at O(1).
+import random
+import time
+
+def calculate_statistics_sorted(numbers):
     mean = sum(numbers) / len(numbers)
     median = sorted(numbers)[len(numbers) // 2]
     return [mean, median]
-stats = calculate_statistics([1, 2, 3, 4, 5])
+
+def benchmark_statistics(size=10 ** 7):
+    numbers = [random.random() for _ in range(size)]
+    for label, func, data in (("calculate_statistics_sorted(list)", calculate_statistics_sorted, numbers),
+                              ("calculate_statistics(list)", calculate_statistics, numbers),
+                              ("calculate_statistics(generator)", calculate_statistics, (x for x in numbers))):
+        start = time.perf_counter()
+        result = func(data)
+        print(f"{label}: {time.perf_counter() - start:.2f}s -> {result}")
+
+benchmark_statistics(size=10 ** 4)
+# benchmark_statistics()  # Full run on 10^7 floats
+
+# Benchmark: the same numbers as a list and as an array.array (NumPy path if installed)
+def benchmark_typed_statistics(size=10 ** 6):
+    numbers = [random.random() for _ in range(size)]
+    for label, data in (("list", numbers), ("array('d')", array.array('d', numbers))):
+        start = time.perf_counter()
+        calculate_statistics(data)
+        print(f"{label}: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+benchmark_typed_statistics(size=10 ** 4)
+# benchmark_typed_statistics()  # Full run on 10^6 floats
 
 # 3.	Stack or Queue Implementations:
 # o	Use lists to implement stack (LIFO) or queue (FIFO) structures.
@@ -218,12 +360,70 @@ person = {"name": "Alice", "age": 25}
 # Example: To-Do List Application
 # Here's an example that demonstrates using lists in a simple to-do list application:
 
+# A plain list works for a handful of tasks, but list.remove() has to scan the whole list
+# to find the task, so removing is O(n). With hundreds of thousands of tasks that adds up.
+# TaskStore keeps the tasks in insertion order in a list of "slots" and indexes every task
+# name to the slots holding it. Removing a task only marks its slot as removed (a tombstone),
+# and the slots are compacted once more than half of them are tombstones, so add and remove
+# are both O(1) (amortised). Duplicate task names are allowed, just like in a list.
+from collections import deque
+
+_REMOVED = object()  # Marker for a removed slot
+
+class TaskStore:
+    def __init__(self, tasks=()):
+        self._slots = []  # Tasks in insertion order, removed ones replaced by _REMOVED
+        self._index = {}  # Task name -> deque of slot positions, oldest first
+        self._live = 0
+        self.add_many(tasks)
+
+    def add(self, task):
+        self._index.setdefault(task, deque()).append(len(self._slots))
+        self._slots.append(task)
+        self._live += 1
+
+    def add_many(self, tasks):
+        for task in tasks:
+            self.add(task)
+
+    def remove(self, task):
+        # Like list.remove(): removes the first occurrence, raises ValueError if missing
+        positions = self._index.get(task)
+        if not positions:
+            raise ValueError(f"{task!r} is not in the task store")
+        self._slots[positions.popleft()] = _REMOVED
+        if not positions:
+            del self._index[task]
+        self._live -= 1
+        if len(self._slots) > 32 and self._live < len(self._slots) // 2:
+            self._compact()
+
+    def remove_many(self, tasks):
+        for task in tasks:
+            self.remove(task)
+
+    def _compact(self):
+        # Drop the tombstones and rebuild the index in one O(n) pass
+        self._slots = [task for task in self._slots if task is not _REMOVED]
+        self._index = {}
+        for position, task in enumerate(self._slots):
+            self._index.setdefault(task, deque()).append(position)
+
+    def __contains__(self, task):
+        return task in self._index
+
+    def __len__(self):
+        return self._live
+
+    def __iter__(self):
+        return (task for task in self._slots if task is not _REMOVED)
+
 # Initialize an empty to-do list
-todo_list = []
+todo_list = TaskStore()
 
 # Function to add a task
 def add_task(task):
-    todo_list.append(task)
+    todo_list.add(task)
 
 # Function to remove a task by name
 def remove_task(task):
@@ -248,6 +448,37 @@ remove_task("Test application")
 # Displaying tasks again
 show_tasks()
 
+# Adding and removing many tasks at once
+todo_list.add_many(["Write docs", "Review PR", "Release"])
+todo_list.remove_many(["Write docs", "Review PR"])
+show_tasks()
+
+# Benchmark: time per removal for a growing number of tasks.
+# With a list the time per removal grows with the size, with TaskStore it stays flat.
+import time
+
+def benchmark_task_removal(sizes=(10 ** 4, 10 ** 5, 10 ** 6), removals=1000):
+    for size in sizes:
+        tasks = [f"task {i}" for i in range(size)]
+        # Remove tasks from the middle, the typical worst case for a list
+        victims = tasks[size // 2:size // 2 + removals]
+
+        store = TaskStore(tasks)
+        start = time.perf_counter()
+        store.remove_many(victims)
+        store_time = (time.perf_counter() - start) / removals
+
+        plain_list = list(tasks)
+        start = time.perf_counter()
+        for task in victims:
+            plain_list.remove(task)
+        list_time = (time.perf_counter() - start) / removals
+
+        print(f"{size:>9} tasks: TaskStore {store_time * 1e6:.2f} us/remove, list {list_time * 1e6:.2f} us/remove")
+
+benchmark_task_removal(sizes=(10 ** 3, 10 ** 4), removals=100)
+# benchmark_task_removal()  # Full run up to 10^6 tasks
+
 
 # Summary
 # Use lists when you need an ordered, mutable collection that can hold heterogeneous items and allows duplicates. 
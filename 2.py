@@ -110,9 +110,23 @@ coordinates = (10, 20)
 location = {(40.7128, -74.0060): "New York", (34.0522, -118.2437): "Los Angeles"}
 
 # 3.	Returning Multiple Values: Returning multiple values from a function.
+# For typed numeric buffers (array.array, memoryview, NumPy arrays) the min and max are
+# computed with NumPy when it is installed, which avoids boxing every element into a Python object.
+import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 def get_min_max(numbers):
+    if np is not None and isinstance(numbers, (np.ndarray, array.array, memoryview)):
+        values = np.asarray(numbers)
+        if values.size:
+            return values.min().item(), values.max().item()
     return min(numbers), max(numbers)
 min_num, max_num = get_min_max([1, 2, 3, 4, 5])
+min_num, max_num = get_min_max(array.array('i', [1, 2, 3, 4, 5]))
 
 # 4.	Grouping Data: Grouping related data together.
 student = ("Alice", 23, "A")
@@ -172,6 +186,44 @@ def divide_numbers(dividend, divisor):
     return quotient, remainder
 result = divide_numbers(10, 3)
 
+# Dividing many pairs at once
+# Calling divide_numbers() in a loop creates a tuple per pair. divide_numbers_many() takes two
+# sequences or buffers of integers and returns the results as two compact array('q') columns
+# (8 bytes per number). A zero divisor doesn't raise ZeroDivisionError in the middle of the
+# batch: its row gets quotient and remainder 0 and is flagged with 1 in the zero_divisors mask.
+# With NumPy installed the whole batch is divided in one vectorised call.
+def divide_numbers_many(dividends, divisors):
+    if len(dividends) != len(divisors):
+        raise ValueError("dividends and divisors must have the same length")
+    if np is not None:
+        a = np.asarray(dividends, dtype=np.int64)
+        b = np.asarray(divisors, dtype=np.int64)
+        zero = b == 0
+        with np.errstate(divide="ignore"):
+            q, r = np.divmod(a, np.where(zero, 1, b))
+        q[zero] = 0
+        r[zero] = 0
+        quotients = array.array('q')
+        quotients.frombytes(q.tobytes())
+        remainders = array.array('q')
+        remainders.frombytes(r.tobytes())
+        return quotients, remainders, bytearray(zero.astype(np.uint8).tobytes())
+    quotients = array.array('q')
+    remainders = array.array('q')
+    zero_divisors = bytearray(len(divisors))
+    for i, (dividend, divisor) in enumerate(zip(dividends, divisors)):
+        if divisor:
+            quotient, remainder = divmod(dividend, divisor)
+        else:
+            quotient = remainder = 0
+            zero_divisors[i] = 1
+        quotients.append(quotient)
+        remainders.append(remainder)
+    return quotients, remainders, zero_divisors
+
+quotients, remainders, zero_divisors = divide_numbers_many(array.array('q', [10, 7, 9]), array.array('q', [3, 0, 2]))
+print(list(quotients), list(remainders), list(zero_divisors))  # [3, 0, 4] [1, 0, 1] [0, 1, 0]
+
 # Example 3: Dictionary Keys with Tuples
 # Using tuples as keys in a dictionary
 coordinates = {
@@ -180,6 +232,170 @@ coordinates = {
     (51.5074, -0.1278): "London"
 }
 
+# Nearest-city and radius queries on a coordinates dictionary
+# A dictionary keyed by (lat, lon) can only answer "which city is at exactly these coordinates?".
+# GeoIndex answers "which cities are nearest?" and "which cities are within N km?" without
+# checking every point. Each (lat, lon) is turned into a point on the unit sphere (x, y, z)
+# and put into a grid of equally sized cubes (a "grid hash": cube -> list of points).
+# Straight-line distance between those points grows with the distance along the Earth's
+# surface, so a query only needs to look at the cubes around the query point.
+import heapq
+import math
+
+EARTH_RADIUS_KM = 6371.0
+
+def to_unit_vector(lat, lon):
+    lat, lon = math.radians(lat), math.radians(lon)
+    return (math.cos(lat) * math.cos(lon), math.cos(lat) * math.sin(lon), math.sin(lat))
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+def km_to_chord(km):
+    # Surface distance -> straight-line distance on the unit sphere
+    return 2 * math.sin(min(km / EARTH_RADIUS_KM, math.pi) / 2)
+
+def chord_to_km(chord):
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, chord / 2))
+
+class GeoIndex:
+    def __init__(self, places, cell_km=None):
+        # places: dictionary like {(lat, lon): name}
+        if cell_km is None:
+            # Aim for a few points per cube: the sphere's area is 4*pi, so cubes of side
+            # sqrt(16*pi / n) give about n / 4 occupied cubes
+            cell = math.sqrt(16 * math.pi / max(len(places), 1))
+        else:
+            cell = km_to_chord(cell_km)
+        self.cell = min(cell, 2.0)
+        self.cells = {}
+        for (lat, lon), name in places.items():
+            xyz = to_unit_vector(lat, lon)
+            self.cells.setdefault(self._cell_of(xyz), []).append((xyz, (lat, lon), name))
+        self.size = len(places)
+
+    def _cell_of(self, xyz):
+        return tuple(int(math.floor(c / self.cell)) for c in xyz)
+
+    def _ring(self, center, r):
+        # Cubes whose largest offset from the center cube is exactly r
+        cx, cy, cz = center
+        for dx in range(-r, r + 1):
+            for dy in range(-r, r + 1):
+                if abs(dx) == r or abs(dy) == r:
+                    dzs = range(-r, r + 1)
+                else:
+                    dzs = (-r, r) if r else (0,)
+                for dz in dzs:
+                    points = self.cells.get((cx + dx, cy + dy, cz + dz))
+                    if points:
+                        yield points
+
+    def _rings(self, center):
+        # Yields (r, points) for the occupied cubes, ring by ring outwards. Walking a ring also
+        # looks at its empty cubes, so once a ring has more cubes than there are occupied ones
+        # (far from clustered data), sort the remaining occupied cubes by ring instead
+        max_ring = int(2 / self.cell) + 2
+        r = 0
+        while r <= max_ring and (2 * r + 1) ** 3 - max(2 * r - 1, 0) ** 3 <= len(self.cells):
+            for points in self._ring(center, r):
+                yield r, points
+            r += 1
+        remaining = sorted(
+            (max(abs(c - m) for c, m in zip(cell, center)), cell) for cell in self.cells
+        )
+        for ring, cell in remaining:
+            if ring >= r:
+                yield ring, self.cells[cell]
+
+    def nearest(self, lat, lon, k=1):
+        # Returns up to k (distance_km, (lat, lon), name) tuples, closest first
+        if k <= 0:
+            return []
+        q = to_unit_vector(lat, lon)
+        center = self._cell_of(q)
+        best = []  # Max-heap of (-chord, counter, point) holding the k closest so far
+        counter = 0
+        for r, points in self._rings(center):
+            # Any point in ring r or further out is at least r - 1 cubes away
+            if len(best) == k and -best[0][0] <= (r - 1) * self.cell:
+                break
+            for xyz, coords, name in points:
+                chord = math.dist(q, xyz)
+                counter += 1
+                if len(best) < k:
+                    heapq.heappush(best, (-chord, counter, coords, name))
+                elif chord < -best[0][0]:
+                    heapq.heapreplace(best, (-chord, counter, coords, name))
+        return [(chord_to_km(-chord), coords, name) for chord, _, coords, name in sorted(best, reverse=True)]
+
+    def within(self, lat, lon, km):
+        # Returns (distance_km, (lat, lon), name) tuples within km, closest first
+        q = to_unit_vector(lat, lon)
+        limit = km_to_chord(km)
+        low = self._cell_of(tuple(c - limit for c in q))
+        high = self._cell_of(tuple(c + limit for c in q))
+        if math.prod(h - l + 1 for l, h in zip(low, high)) > len(self.cells):
+            # The box has more cubes than there are occupied ones: check those instead
+            groups = [points for cell, points in self.cells.items()
+                      if all(l <= c <= h for c, l, h in zip(cell, low, high))]
+        else:
+            groups = [self.cells.get((x, y, z), ()) for x in range(low[0], high[0] + 1)
+                      for y in range(low[1], high[1] + 1) for z in range(low[2], high[2] + 1)]
+        found = []
+        for points in groups:
+            for xyz, coords, name in points:
+                chord = math.dist(q, xyz)
+                if chord <= limit:
+                    found.append((chord_to_km(chord), coords, name))
+        found.sort()
+        return found
+
+    def __len__(self):
+        return self.size
+
+# Brute-force reference: checks every point, useful to verify GeoIndex results
+def brute_force_nearest(places, lat, lon, k=1):
+    distances = sorted((haversine_km(lat, lon, *coords), coords, name) for coords, name in places.items())
+    return distances[:k]
+
+def brute_force_within(places, lat, lon, km):
+    return sorted(
+        (d, coords, name)
+        for coords, name in places.items()
+        if (d := haversine_km(lat, lon, *coords)) <= km
+    )
+
+city_index = GeoIndex(coordinates)
+print(city_index.nearest(48.8566, 2.3522, k=1))  # Paris -> London is the closest city
+print(city_index.within(40.0, -75.0, 200))  # New York is about 116 km away
+
+# Benchmark: GeoIndex against brute force on random points
+import random
+import time
+
+def benchmark_geo_index(size=10 ** 6, queries=100):
+    places = {(random.uniform(-90, 90), random.uniform(-180, 180)): f"place {i}" for i in range(size)}
+    start = time.perf_counter()
+    index = GeoIndex(places)
+    print(f"build {size} points: {time.perf_counter() - start:.2f}s")
+    targets = [(random.uniform(-90, 90), random.uniform(-180, 180)) for _ in range(queries)]
+    for label, nearest, within in (
+        ("GeoIndex", index.nearest, index.within),
+        ("brute force", lambda lat, lon, k: brute_force_nearest(places, lat, lon, k),
+         lambda lat, lon, km: brute_force_within(places, lat, lon, km)),
+    ):
+        start = time.perf_counter()
+        for lat, lon in targets:
+            nearest(lat, lon, 5)
+            within(lat, lon, 50)
+        print(f"{label}: {(time.perf_counter() - start) / queries * 1000:.2f} ms per nearest+within query")
+
+benchmark_geo_index(size=10 ** 4, queries=20)
+# benchmark_geo_index()  # Full run on 10^6 points
+
 # Example 4: Sequence Unpacking
 # Unpacking a tuple into variables
 person = ("Alice", 30, "New York")
@@ -122,17 +122,270 @@ users = {
     "user2": {"name": "Bob", "age": 25}
 }
 
+# Looking a record up by its key is fast, but a question like "which users are older than 30?"
+# has to scan every record. Table adds secondary indexes, like a real database:
+# o	"hash" index: dictionary value -> {key: record}, for equality (==) conditions.
+# o	"sorted" index: list of (value, key, record) kept sorted with bisect, for ranges (<, <=, >, >=).
+# Indexes are updated on every insert and delete. query() takes conditions like ("age", ">", 30),
+# asks each usable index how many records it would return, starts from the smallest candidate
+# set and checks the other conditions on those records only. explain() shows the chosen plan.
+# The indexes keep a reference to each record, so they don't have to go back to the table for it.
+import bisect
+import operator
+import time
+
+OPERATORS = {
+    "==": operator.eq, "!=": operator.ne,
+    "<": operator.lt, "<=": operator.le, ">": operator.gt, ">=": operator.ge,
+}
+
+class HashIndex:
+    operators = {"=="}
+
+    def __init__(self):
+        self.records_by_value = {}
+
+    def add(self, value, key, record):
+        self.records_by_value.setdefault(value, {})[key] = record
+
+    def bulk_load(self, entries):
+        for value, key, record in entries:
+            self.add(value, key, record)
+
+    def remove(self, value, key):
+        records = self.records_by_value[value]
+        records.pop(key, None)
+        if not records:
+            del self.records_by_value[value]
+
+    def estimate(self, op, value):
+        return len(self.records_by_value.get(value, ()))
+
+    def lookup(self, op, value):
+        return self.records_by_value.get(value, {}).items()
+
+class SortedIndex:
+    operators = {"==", "<", "<=", ">", ">="}
+
+    def __init__(self):
+        # (value, key, record) sorted by value, then key. Keys are unique, so records are never compared.
+        self.entries = []
+
+    def add(self, value, key, record):
+        bisect.insort(self.entries, (value, key, record))
+
+    def bulk_load(self, entries):
+        # One sort instead of an O(n) insort per record
+        self.entries.extend(entries)
+        self.entries.sort(key=operator.itemgetter(0, 1))
+
+    def remove(self, value, key):
+        # (value, key) sorts just before (value, key, record)
+        i = bisect.bisect_left(self.entries, (value, key))
+        if i < len(self.entries) and self.entries[i][:2] == (value, key):
+            del self.entries[i]
+
+    def _bounds(self, op, value):
+        first = operator.itemgetter(0)
+        low, high = 0, len(self.entries)
+        if op in ("==", ">="):
+            low = bisect.bisect_left(self.entries, value, key=first)
+        elif op == ">":
+            low = bisect.bisect_right(self.entries, value, key=first)
+        if op in ("==", "<="):
+            high = bisect.bisect_right(self.entries, value, key=first)
+        elif op == "<":
+            high = bisect.bisect_left(self.entries, value, key=first)
+        return low, max(low, high)
+
+    def estimate(self, op, value):
+        low, high = self._bounds(op, value)
+        return high - low
+
+    def lookup(self, op, value):
+        low, high = self._bounds(op, value)
+        return [(key, record) for _, key, record in self.entries[low:high]]
+
+INDEX_KINDS = {"hash": HashIndex, "sorted": SortedIndex}
+
+class Table:
+    def __init__(self, records=None, indexes=None):
+        # records: {key: {"field": value, ...}}, indexes: {"field": "hash" or "sorted"}
+        self.records = dict(records or {})
+        self.indexes = {}
+        for field, kind in (indexes or {}).items():
+            self.create_index(field, kind)
+
+    def create_index(self, field, kind="hash"):
+        index = self.indexes[field] = INDEX_KINDS[kind]()
+        index.bulk_load((record[field], key, record) for key, record in self.records.items() if field in record)
+
+    def insert(self, key, record):
+        if key in self.records:
+            self.delete(key)
+        self.records[key] = record
+        for field, index in self.indexes.items():
+            if field in record:
+                index.add(record[field], key, record)
+
+    def delete(self, key):
+        record = self.records.pop(key)
+        for field, index in self.indexes.items():
+            if field in record:
+                index.remove(record[field], key)
+
+    def __getitem__(self, key):
+        return self.records[key]
+
+    def __len__(self):
+        return len(self.records)
+
+    def plan(self, conditions):
+        # Returns (estimated rows, condition) for the cheapest indexed condition, or None for a full scan
+        best = None
+        for condition in conditions:
+            field, op, value = condition
+            index = self.indexes.get(field)
+            if index is not None and op in index.operators:
+                estimate = index.estimate(op, value)
+                if best is None or estimate < best[0]:
+                    best = (estimate, condition)
+        return best
+
+    def explain(self, *conditions):
+        best = self.plan(conditions)
+        if best is None:
+            return f"full scan of {len(self.records)} records"
+        estimate, (field, op, value) = best
+        kind = type(self.indexes[field]).__name__
+        return f"{kind} on {field!r} for {field} {op} {value!r}, about {estimate} records"
+
+    def query(self, *conditions):
+        # Returns the (key, record) pairs matching all conditions
+        best = self.plan(conditions)
+        if best is None:
+            candidates = self.records.items()
+        else:
+            field, op, value = best[1]
+            candidates = self.indexes[field].lookup(op, value)
+            # The index already guarantees the condition it was chosen for
+            conditions = [condition for condition in conditions if condition is not best[1]]
+        checks = [(field, OPERATORS[op], value) for field, op, value in conditions]
+        if not checks:
+            return list(candidates)
+        return [
+            (key, record)
+            for key, record in candidates
+            if all(field in record and check(record[field], value) for field, check, value in checks)
+        ]
+
+user_table = Table(users, indexes={"name": "hash", "age": "sorted"})
+user_table.insert("user3", {"name": "Charlie", "age": 35})
+print(user_table.query(("age", ">", 28)))  # Alice and Charlie
+print(user_table.explain(("age", ">", 28), ("name", "==", "Alice")))  # Uses the hash index on name
+
+# Benchmark: indexed queries against a full scan on 10^6 records
+import random
+
+def benchmark_table_queries(size=10 ** 6, queries=100):
+    names = [f"name{i}" for i in range(10000)]
+    records = {f"user{i}": {"name": random.choice(names), "age": random.randint(18, 90)} for i in range(size)}
+    start = time.perf_counter()
+    table = Table(records, indexes={"name": "hash", "age": "sorted"})
+    print(f"build {size} records with 2 indexes: {time.perf_counter() - start:.2f}s")
+    scan = Table(records)
+    for label, conditions in (
+        ("name == ?", lambda: [("name", "==", random.choice(names))]),
+        ("age > 88", lambda: [("age", ">", 88)]),
+    ):
+        for name, t in (("indexed", table), ("full scan", scan)):
+            start = time.perf_counter()
+            for _ in range(queries):
+                t.query(*conditions())
+            print(f"{label} {name}: {(time.perf_counter() - start) / queries * 1000:.2f} ms per query")
+
+benchmark_table_queries(size=10 ** 4, queries=10)
+# benchmark_table_queries()  # Full run on 10^6 records
+
 # 4.	Caching and Memoization:
 # o	Use dictionaries to cache results of expensive computations based on input parameters (memoization).
-cache = {}
+# A plain module-level dict grows forever and isn't safe to share between threads.
+# The memoize decorator below keeps the cache bounded:
+# o	maxsize: least recently used entries are evicted (LRU) once the cache is full.
+# o	ttl: entries older than ttl seconds are treated as missing and recomputed.
+# o	The cache is split into stripes, each an OrderedDict with its own lock, so threads
+#   working on different keys rarely wait for each other.
+# o	cache_info() reports hits, misses and the current size.
+import threading
+import time
+from collections import OrderedDict
+
+def memoize(maxsize=128, ttl=None, stripes=8):
+    if maxsize is not None:
+        stripes = max(1, min(stripes, maxsize))
+        # Split maxsize exactly: the first maxsize % stripes stripes get one extra slot
+        stripe_sizes = [maxsize // stripes + (i < maxsize % stripes) for i in range(stripes)]
+    else:
+        stripe_sizes = [None] * stripes
+
+    def decorator(func):
+        caches = [OrderedDict() for _ in range(stripes)]
+        locks = [threading.Lock() for _ in range(stripes)]
+        hits = [0] * stripes
+        misses = [0] * stripes
+
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+            i = hash(key) % stripes
+            cache, lock = caches[i], locks[i]
+            with lock:
+                entry = cache.get(key)
+                if entry is not None and (ttl is None or entry[1] > time.monotonic()):
+                    cache.move_to_end(key)
+                    hits[i] += 1
+                    return entry[0]
+                misses[i] += 1
+            # Compute outside the lock so a slow call doesn't block the whole stripe
+            value = func(*args, **kwargs)
+            expires = time.monotonic() + ttl if ttl is not None else None
+            with lock:
+                cache[key] = (value, expires)
+                cache.move_to_end(key)
+                if stripe_sizes[i] is not None and len(cache) > stripe_sizes[i]:
+                    cache.popitem(last=False)
+            return value
+
+        def cache_info():
+            return {"hits": sum(hits), "misses": sum(misses), "size": sum(len(c) for c in caches), "maxsize": maxsize}
+
+        def cache_clear():
+            for cache, lock in zip(caches, locks):
+                with lock:
+                    cache.clear()
+
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        wrapper.__name__ = func.__name__
+        wrapper.__wrapped__ = func
+        return wrapper
+    return decorator
+
+# fibonacci() uses "fast doubling": F(2k) = F(k) * (2*F(k+1) - F(k)) and F(2k+1) = F(k)^2 + F(k+1)^2.
+# Walking the bits of n from the top gives F(n) in O(log n) steps with no recursion,
+# so fibonacci(10000) works without hitting the recursion limit.
+@memoize(maxsize=1024)
 def fibonacci(n):
-    if n in cache:
-        return cache[n]
     if n <= 2:
         return 1
-    result = fibonacci(n-1) + fibonacci(n-2)
-    cache[n] = result
-    return result
+    a, b = 0, 1  # F(k), F(k+1) starting at k = 0
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a)  # F(2k)
+        d = a * a + b * b    # F(2k+1)
+        if bit == "1":
+            a, b = d, c + d
+        else:
+            a, b = c, d
+    return a
 
 # 5.	Mapping Keys to Values:
 # o	Dictionaries are fundamental for mapping keys to corresponding values efficiently.
@@ -182,19 +435,161 @@ user_profiles = {
     1003: {"name": "Charlie", "age": 35}
 }
 
+# Every profile above is its own small dictionary, which costs a few hundred bytes before any
+# data is stored. With millions of users that overhead dominates memory.
+# ProfileTable stores the same data by column instead:
+# o	ids: a sorted array('q') of user IDs (8 bytes each), looked up with bisect.
+# o	int / float fields: one array('q') / array('d') per field (8 bytes per value).
+# o	str fields: interned, each distinct string is stored once and the column keeps a 4-byte
+#   code per row (array('I')). This pays off for values that repeat, like names or cities.
+# table[user_id] returns a ProfileRow, a tiny view that reads the columns on access.
+import array
+import bisect
+
+COLUMN_TYPECODES = {int: "q", float: "d", str: "I"}
+
+class ProfileRow:
+    __slots__ = ("table", "user_id")
+
+    def __init__(self, table, user_id):
+        self.table = table
+        self.user_id = user_id
+
+    def __getitem__(self, field):
+        return self.table.get_value(self.user_id, field)
+
+    def get(self, field, default=None):
+        return self[field] if field in self.table.fields else default
+
+    def keys(self):
+        return self.table.fields.keys()
+
+    def to_dict(self):
+        return {field: self[field] for field in self.table.fields}
+
+    def __repr__(self):
+        return f"ProfileRow({self.user_id}, {self.to_dict()})"
+
+class ProfileTable:
+    def __init__(self, fields):
+        # fields: {"name": str, "age": int}
+        self.fields = dict(fields)
+        self.ids = array.array("q")
+        self.columns = {field: array.array(COLUMN_TYPECODES[kind]) for field, kind in self.fields.items()}
+        self.strings = {field: [] for field, kind in self.fields.items() if kind is str}  # code -> string
+        self.string_codes = {field: {} for field in self.strings}  # string -> code
+
+    @classmethod
+    def from_dict(cls, profiles, fields):
+        # Bulk load from the {user_id: {"name": ..., "age": ...}} form: one sort, then appends.
+        # Use this for large loads; table[user_id] = ... is O(n) unless ids arrive in increasing order
+        table = cls(fields)
+        for user_id in sorted(profiles):
+            table.ids.append(user_id)
+            profile = profiles[user_id]
+            for field in table.fields:
+                table.columns[field].append(table._encode(field, profile[field]))
+        return table
+
+    def _encode(self, field, value):
+        codes = self.string_codes.get(field)
+        if codes is None:
+            return value
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(self.strings[field])
+            self.strings[field].append(value)
+        return code
+
+    def _position(self, user_id):
+        i = bisect.bisect_left(self.ids, user_id)
+        if i == len(self.ids) or self.ids[i] != user_id:
+            raise KeyError(user_id)
+        return i
+
+    def get_value(self, user_id, field):
+        value = self.columns[field][self._position(user_id)]
+        strings = self.strings.get(field)
+        return strings[value] if strings is not None else value
+
+    def __getitem__(self, user_id):
+        self._position(user_id)
+        return ProfileRow(self, user_id)
+
+    def get(self, user_id, default=None):
+        return self[user_id] if user_id in self else default
+
+    def __setitem__(self, user_id, profile):
+        values = [self._encode(field, profile[field]) for field in self.fields]
+        if not self.ids or user_id > self.ids[-1]:
+            # New largest id (e.g. increasing ids): append, O(1)
+            self.ids.append(user_id)
+            for field, value in zip(self.fields, values):
+                self.columns[field].append(value)
+            return
+        i = bisect.bisect_left(self.ids, user_id)
+        if i < len(self.ids) and self.ids[i] == user_id:
+            for field, value in zip(self.fields, values):
+                self.columns[field][i] = value
+            return
+        # An id in the middle shifts every later entry of every column: O(n) per id, so load
+        # many unsorted rows with from_dict() instead
+        self.ids.insert(i, user_id)
+        for field, value in zip(self.fields, values):
+            self.columns[field].insert(i, value)
+
+    def __contains__(self, user_id):
+        i = bisect.bisect_left(self.ids, user_id)
+        return i < len(self.ids) and self.ids[i] == user_id
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __iter__(self):
+        return iter(self.ids)
+
+    def items(self):
+        return ((user_id, ProfileRow(self, user_id)) for user_id in self.ids)
+
+profile_table = ProfileTable.from_dict(user_profiles, {"name": str, "age": int})
+print(profile_table[1002]["name"])  # Bob
+profile_table[1004] = {"name": "David", "age": 28}
+print(profile_table[1004].to_dict())  # {'name': 'David', 'age': 28}
+
+# Benchmark: memory of the nested dictionaries against ProfileTable, measured with tracemalloc
+import random
+import tracemalloc
+
+def benchmark_profile_memory(size=10 ** 6):
+    first_names = [f"name{i}" for i in range(1000)]
+    rows = [(1000 + i, random.choice(first_names), random.randint(18, 90)) for i in range(size)]
+
+    tracemalloc.start()
+    profiles = {user_id: {"name": name, "age": age} for user_id, name, age in rows}
+    dict_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    table = ProfileTable.from_dict(profiles, {"name": str, "age": int})
+    table_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    print(f"{size} profiles: dicts {dict_bytes / 2 ** 20:.1f} MiB, "
+          f"ProfileTable {table_bytes / 2 ** 20:.1f} MiB ({dict_bytes / table_bytes:.1f}x smaller)")
+    return table
+
+benchmark_profile_memory(size=10 ** 4)
+# benchmark_profile_memory()  # Full run on 10^6 profiles
+
 # 5. Caching and Memoization
 # Dictionaries are often used for caching computed results to improve performance by avoiding redundant calculations:
-# Memoizing results of expensive computations
-cache = {}
+# Memoizing results of expensive computations: the memoize decorator defined above can wrap
+# the undecorated fibonacci (kept in __wrapped__) again, here with entries expiring after an hour
+fibonacci = memoize(maxsize=256, ttl=3600)(fibonacci.__wrapped__)
 
-def fibonacci(n):
-    if n in cache:
-        return cache[n]
-    if n <= 2:
-        return 1
-    result = fibonacci(n-1) + fibonacci(n-2)
-    cache[n] = result
-    return result
+fibonacci(1000)
+fibonacci(1000)
+print(fibonacci.cache_info())  # {'hits': 1, 'misses': 1, 'size': 1, 'maxsize': 256}
 
 # 6. Counting and Grouping
 # Dictionaries are effective for counting occurrences or grouping items based on certain criteria:
@@ -209,14 +604,297 @@ for word in text.split():
 print(word_count)
 # Output: {'hello': 2, 'world': 2, 'python': 1}
 
+# Counting words in very large files
+# text.split() needs the whole text in memory. count_words() reads the source in fixed-size
+# chunks instead, and counts each chunk with Counter.update(). A word that is cut in half at
+# the end of a chunk is carried over and glued to the start of the next chunk.
+# The source can be a file path, an open text file, or any iterable of strings.
+# With processes > 1 a file is split into byte ranges, each range is counted in its own
+# process, and the Counters are merged. Ranges are only cut at ASCII whitespace, which
+# never appears inside a multi-byte UTF-8 character, so every word is counted exactly once.
+# (On platforms that start processes with "spawn", call it under if __name__ == "__main__".)
+import os
+import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+LEADING_WORD_BYTES = re.compile(rb"\S*")
+
+def end_of_last_space(buffer):
+    # Index just after the last ASCII whitespace byte, 0 if there is none
+    return max(buffer.rfind(space) for space in b" \t\n\r\x0b\x0c") + 1
+
+def count_words(source, chunk_size=1 << 20, processes=1):
+    if isinstance(source, (str, os.PathLike)):
+        if processes > 1:
+            return count_words_parallel(source, processes, chunk_size)
+        with open(source, encoding="utf-8") as file:
+            return count_words(file, chunk_size)
+    if hasattr(source, "read"):
+        chunks = iter(lambda: source.read(chunk_size), "")
+    else:
+        chunks = source
+    counts = Counter()
+    tail = ""
+    for chunk in chunks:
+        words = (tail + chunk).split()
+        # If the chunk doesn't end with whitespace its last word may continue in the next chunk
+        tail = words.pop() if words and not chunk[-1:].isspace() else ""
+        counts.update(words)
+    if tail:
+        counts[tail] += 1
+    return counts
+
+def count_words_in_range(path, start, end, chunk_size):
+    # Counts the words that start inside [start, end) of the file
+    counts = Counter()
+    with open(path, "rb") as file:
+        if start > 0:
+            file.seek(start - 1)
+            if not file.read(1).isspace():
+                # We are inside a word that belongs to the previous range: skip it
+                while True:
+                    chunk = file.read(chunk_size)
+                    skip = LEADING_WORD_BYTES.match(chunk).end()
+                    if skip < len(chunk) or not chunk:
+                        file.seek(skip - len(chunk), os.SEEK_CUR)
+                        break
+        position = file.tell()
+        tail = b""
+        while position < end:
+            chunk = file.read(min(chunk_size, end - position))
+            if not chunk:
+                break
+            position += len(chunk)
+            chunk = tail + chunk
+            cut = end_of_last_space(chunk)
+            counts.update(chunk[:cut].decode("utf-8").split())
+            tail = chunk[cut:]
+        # Finish the word that crosses the end of the range
+        while tail and not tail[-1:].isspace():
+            chunk = file.read(chunk_size)
+            if not chunk:
+                break
+            word_end = LEADING_WORD_BYTES.match(chunk).end()
+            tail += chunk[:word_end]
+            if word_end < len(chunk):
+                break
+        counts.update(tail.decode("utf-8").split())
+    return counts
+
+def count_words_parallel(path, processes=4, chunk_size=1 << 20):
+    size = os.path.getsize(path)
+    step = -(-size // processes) or 1
+    ranges = [(start, min(start + step, size)) for start in range(0, size, step)]
+    counts = Counter()
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        futures = [executor.submit(count_words_in_range, path, start, end, chunk_size) for start, end in ranges]
+        for future in futures:
+            counts.update(future.result())
+    return counts
+
+print(count_words(["hello wor", "ld hello python ", "world"]))
+# Output: Counter({'hello': 2, 'world': 2, 'python': 1})
+
+# Benchmark: the dictionary loop above against count_words() on a generated file
+import random
+import tempfile
+
+def count_words_loop(path):
+    with open(path, encoding="utf-8") as file:
+        text = file.read()
+    word_count = {}
+    for word in text.split():
+        if word in word_count:
+            word_count[word] += 1
+        else:
+            word_count[word] = 1
+    return word_count
+
+def benchmark_word_count(size=1 << 30, processes=4):
+    vocabulary = [f"word{i}" for i in range(10000)]
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "words.txt")
+        with open(path, "w", encoding="utf-8") as file:
+            line = " ".join(random.choices(vocabulary, k=20000)) + "\n"
+            for _ in range(max(1, size // len(line))):
+                file.write(line)
+        runs = [("dict loop", count_words_loop), ("count_words", count_words)]
+        if processes > 1:
+            runs.append((f"count_words processes={processes}", lambda path: count_words(path, processes=processes)))
+        for label, func in runs:
+            start = time.perf_counter()
+            func(path)
+            print(f"{label}: {time.perf_counter() - start:.2f}s")
+
+benchmark_word_count(size=1 << 20, processes=1)
+# Full run on a 1 GB file; the process pool needs the __main__ guard under "spawn" (macOS, Windows):
+# if __name__ == "__main__":
+#     benchmark_word_count()
+
 # 7. Handling Responses and API Data
 # When working with APIs or receiving structured data, dictionaries are often used to handle responses and parse data:
 # Processing JSON response from an API
 import requests
 
-response = requests.get("https://api.example.com/data")
+response = requests.get("https://api.example.com/data", timeout=10)
 data = response.json()  # Assume data is a dictionary
 
+# Calling requests.get() for every request opens a new connection (and TLS handshake) each time
+# and caches nothing. ApiClient keeps one requests.Session whose connection pool reuses open
+# connections (keep-alive), and keeps responses in a dictionary keyed by URL:
+# o	Cache-Control: max-age=N -> the cached data is returned without a request for N seconds.
+# o	ETag / Last-Modified -> once stale, the request carries If-None-Match / If-Modified-Since,
+#   and a "304 Not Modified" answer reuses the cached data.
+# o	Cache-Control: no-store -> the response is never cached.
+# fetch_many() fetches several URLs at once with a bounded number of threads, and every
+# request's latency is recorded in a LatencyHistogram.
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+
+class LatencyHistogram:
+    BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, float("inf"))
+
+    def __init__(self):
+        self.counts = dict.fromkeys(self.BUCKETS_MS, 0)
+        self.total = 0
+        self.total_ms = 0.0
+        self.lock = threading.Lock()
+
+    def observe(self, seconds):
+        ms = seconds * 1000
+        bucket = next(bound for bound in self.BUCKETS_MS if ms <= bound)
+        with self.lock:
+            self.counts[bucket] += 1
+            self.total += 1
+            self.total_ms += ms
+
+    def summary(self):
+        with self.lock:
+            return {
+                "count": self.total,
+                "mean_ms": self.total_ms / self.total if self.total else 0.0,
+                "buckets": {
+                    f"<={bound}ms" if bound != float("inf") else f">{self.BUCKETS_MS[-2]}ms": count
+                    for bound, count in self.counts.items()
+                },
+            }
+
+def parse_cache_control(header):
+    # "max-age=60, no-cache" -> {"max-age": "60", "no-cache": None}
+    directives = {}
+    for part in header.split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"') or None
+    return directives
+
+class ApiClient:
+    def __init__(self, timeout=10, pool_size=10, max_workers=8):
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.cache = {}  # URL -> {"data", "etag", "last_modified", "expires"}
+        self.cache_lock = threading.Lock()
+        self.latency = LatencyHistogram()
+
+    def get(self, url):
+        with self.cache_lock:
+            entry = self.cache.get(url)
+        if entry is not None and entry["expires"] > time.monotonic():
+            return entry["data"]
+
+        headers = {}
+        if entry is not None:
+            if entry["etag"]:
+                headers["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                headers["If-Modified-Since"] = entry["last_modified"]
+        start = time.perf_counter()
+        response = self.session.get(url, headers=headers, timeout=self.timeout)
+        self.latency.observe(time.perf_counter() - start)
+
+        if response.status_code == 304 and entry is not None:
+            data = entry["data"]
+        else:
+            response.raise_for_status()
+            data = response.json()
+        self._store(url, response, data)
+        return data
+
+    def _store(self, url, response, data):
+        directives = parse_cache_control(response.headers.get("Cache-Control", ""))
+        if "no-store" in directives:
+            with self.cache_lock:
+                self.cache.pop(url, None)
+            return
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        max_age = 0
+        if "no-cache" not in directives and "max-age" in directives:
+            try:
+                max_age = int(directives["max-age"])
+            except (TypeError, ValueError):
+                max_age = 0
+        if max_age or etag or last_modified:
+            with self.cache_lock:
+                self.cache[url] = {
+                    "data": data,
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "expires": time.monotonic() + max_age,
+                }
+
+    def fetch_many(self, urls):
+        # Results come back in the same order as urls
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(self.get, urls))
+
+    def close(self):
+        self.session.close()
+
+# Trying ApiClient against a local stand-in server built with http.server
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+class StandInApiHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive
+    etag = '"v1"'
+
+    def do_GET(self):
+        if self.headers.get("If-None-Match") == self.etag:
+            self.send_response(304)
+            self.send_header("ETag", self.etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = json.dumps({"path": self.path}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", self.etag)
+        self.send_header("Cache-Control", "max-age=0")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # Keep the output quiet
+
+server = ThreadingHTTPServer(("127.0.0.1", 0), StandInApiHandler)
+threading.Thread(target=server.serve_forever, daemon=True).start()
+base_url = f"http://127.0.0.1:{server.server_address[1]}"
+api = ApiClient()
+print(api.fetch_many([f"{base_url}/data/{i}" for i in range(5)]))
+print(api.get(f"{base_url}/data/0"))  # Revalidated with If-None-Match, answered with 304
+print(api.latency.summary())
+api.close()
+server.shutdown()
+server.server_close()
+
 # 8. Flexibility in Data Representation
 # Dictionaries provide flexibility in representing complex or nested data structures, allowing for easy navigation and manipulation:
 # Representing a nested data structure
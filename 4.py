@@ -147,6 +147,180 @@ user = "Alice"
 if user in allowed_users:
     print("Access granted")
 
+# When an allow list holds hundreds of millions of users it no longer fits in every worker.
+# A Bloom filter answers "is this user in the list?" from a fixed-size array of bits:
+# o	"no" is always correct, "yes" is wrong with a small probability (error_rate) you choose.
+# o	For n items and error rate p it needs about -n * ln(p) / ln(2)^2 bits, about 1.2 bytes per
+#   item at 1% instead of the item itself plus a set slot.
+# o	Each item sets k bits, chosen from two 64-bit halves of a blake2b hash (not hash(), which
+#   differs between processes), so a filter saved to a file can be opened by any process.
+#   Items are therefore limited to str, bytes, numbers, None and tuples of those (TypeError otherwise).
+# o	BloomFilter.open(path) memory-maps the file read-only, so all processes share one copy.
+# CountingBloomFilter keeps a small counter instead of a bit, so items can also be removed.
+# ConfirmedSet checks the filter first and only asks the exact set for possible members.
+import hashlib
+import math
+import mmap
+import struct
+import sys
+import time
+
+def item_to_bytes(item):
+    # Stable byte form of an item for hashing (hash() is randomised per process)
+    if isinstance(item, bytes):
+        return item
+    if isinstance(item, str):
+        return item.encode("utf-8")
+    if has_stable_repr(item):
+        return repr(item).encode("utf-8")
+    # e.g. sets (repr follows per-process hash order) or objects (repr contains a memory address)
+    raise TypeError(f"cannot hash {type(item).__name__} items the same way in every process")
+
+def has_stable_repr(item):
+    if type(item) in (int, float, bool, str, bytes) or item is None:
+        return True
+    return type(item) is tuple and all(has_stable_repr(part) for part in item)
+
+class BloomFilter:
+    MAGIC = b"BLM1"
+    HEADER = struct.Struct("<4sQIQ")  # magic, number of slots, hashes per item, items added
+
+    def __init__(self, capacity, error_rate=0.01):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.count = 0
+        self.data = bytearray(self._storage_bytes(self.size))
+
+    @staticmethod
+    def _storage_bytes(size):
+        return (size + 7) // 8
+
+    @classmethod
+    def from_iterable(cls, items, error_rate=0.01, capacity=None):
+        if capacity is None:
+            items = items if hasattr(items, "__len__") else list(items)
+            capacity = max(1, len(items))
+        bloom = cls(capacity, error_rate)
+        bloom.update(items)
+        return bloom
+
+    def _positions(self, item):
+        digest = hashlib.blake2b(item_to_bytes(item), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def add(self, item):
+        for position in self._positions(item):
+            self.data[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def update(self, items):
+        for item in items:
+            self.add(item)
+
+    def __contains__(self, item):
+        data = self.data
+        return all(data[position >> 3] >> (position & 7) & 1 for position in self._positions(item))
+
+    def __len__(self):
+        return self.count
+
+    def save(self, path):
+        with open(path, "wb") as file:
+            file.write(self.HEADER.pack(self.MAGIC, self.size, self.hash_count, self.count))
+            file.write(self.data)
+
+    @classmethod
+    def open(cls, path):
+        # Memory-maps a saved filter read-only; the operating system shares the pages between processes
+        with open(path, "rb") as file:
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, size, hash_count, count = cls.HEADER.unpack_from(mapping)
+        if magic != cls.MAGIC:
+            raise ValueError(f"{path} is not a {cls.__name__} file")
+        bloom = cls.__new__(cls)
+        bloom.size, bloom.hash_count, bloom.count = size, hash_count, count
+        bloom.mapping = mapping
+        bloom.data = memoryview(mapping)[cls.HEADER.size:cls.HEADER.size + cls._storage_bytes(size)]
+        return bloom
+
+    def close(self):
+        mapping = getattr(self, "mapping", None)
+        if mapping is not None:
+            self.data.release()
+            mapping.close()
+
+class CountingBloomFilter(BloomFilter):
+    MAGIC = b"CBF1"
+
+    @staticmethod
+    def _storage_bytes(size):
+        return size  # One 8-bit counter per slot
+
+    def add(self, item):
+        for position in self._positions(item):
+            if self.data[position] < 255:  # Saturate instead of overflowing
+                self.data[position] += 1
+        self.count += 1
+
+    def remove(self, item):
+        # Only remove items that were added, otherwise other items may start to look absent
+        positions = self._positions(item)
+        if not all(self.data[position] for position in positions):
+            raise KeyError(item)
+        for position in positions:
+            if self.data[position] < 255:
+                self.data[position] -= 1
+        self.count -= 1
+
+    def __contains__(self, item):
+        data = self.data
+        return all(data[position] for position in self._positions(item))
+
+class ConfirmedSet:
+    # "in" is exact: the filter rules out most non-members, the exact set confirms the rest
+    def __init__(self, bloom, exact):
+        self.bloom = bloom
+        self.exact = exact
+
+    def __contains__(self, item):
+        return item in self.bloom and item in self.exact
+
+allowed_filter = BloomFilter.from_iterable(allowed_users, error_rate=0.001)
+allowed = ConfirmedSet(allowed_filter, allowed_users)
+if user in allowed_filter:  # Same "in" operator as the set
+    print("Access probably granted")
+if user in allowed:
+    print("Access granted")
+
+# Benchmark: memory and false-positive rate of BloomFilter against a set
+import os
+import tempfile
+
+def benchmark_bloom_filter(size=10 ** 6, error_rate=0.01):
+    users = [f"user{i}" for i in range(size)]
+    start = time.perf_counter()
+    bloom = BloomFilter.from_iterable(users, error_rate)
+    build = time.perf_counter() - start
+    probes = [f"other{i}" for i in range(100000)]
+    false_positives = sum(probe in bloom for probe in probes)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "users.bloom")
+        bloom.save(path)
+        shared = BloomFilter.open(path)
+        assert all(user in shared for user in users[:1000])
+        shared.close()
+    print(f"{size} users: filter {len(bloom.data) / 2 ** 20:.2f} MiB (set about {sys.getsizeof(set(users)) / 2 ** 20:.2f} MiB "
+          f"without the strings), built in {build:.2f}s, false positives {false_positives / len(probes):.3%}")
+
+benchmark_bloom_filter(size=10 ** 4)
+# benchmark_bloom_filter()  # Full run on 10^6 users
+
 # 3. Mathematical Operations
 # Sets support mathematical operations like union, intersection, difference, and symmetric difference, which are useful in various computational tasks:
 set1 = {1, 2, 3, 4, 5}
@@ -160,6 +334,283 @@ print(set1.difference(set2))  # {1, 2, 3}
 # Symmetric Difference
 print(set1.symmetric_difference(set2))  # {1, 2, 3, 6, 7, 8}
 
+# Sets of millions of integer IDs
+# A set stores every element as a full Python int plus a hash table slot, about 60 bytes per ID.
+# IntSet stores non-negative integers the way "roaring bitmaps" do: numbers are grouped into
+# chunks by their high bits (value >> 16), and each chunk holds the low 16 bits in one of two containers:
+# o	sparse chunk (up to 4096 values): a sorted array('H'), 2 bytes per value.
+# o	dense chunk (more than 4096 values): a 65536-bit bitmap in a bytearray, always 8 KB.
+# Set algebra on bitmaps turns them into Python ints and uses |, &, - and ^ on the whole chunk at once.
+# IntSet has the same set API (union, intersection, difference, symmetric_difference,
+# issubset, issuperset, in, len, iteration, operators) and converts to and from bytes.
+import array
+import bisect
+import struct
+import sys
+
+ARRAY_LIMIT = 4096
+BITMAP_BYTES = 8192  # 65536 bits
+
+def chunk_to_int(container):
+    if isinstance(container, bytearray):
+        return int.from_bytes(container, "little")
+    bits = bytearray(BITMAP_BYTES)
+    for low in container:
+        bits[low >> 3] |= 1 << (low & 7)
+    return int.from_bytes(bits, "little")
+
+def chunk_from_int(bitmap):
+    # Returns the smallest container for the bitmap, or None if it is empty
+    count = bitmap.bit_count()
+    if not count:
+        return None
+    if count > ARRAY_LIMIT:
+        return bytearray(bitmap.to_bytes(BITMAP_BYTES, "little"))
+    return array.array("H", bitmap_values(bitmap))
+
+def bitmap_values(bitmap):
+    # Positions of the set bits, found with str.find() on the reversed binary string,
+    # so the Python loop runs once per value instead of once per bit
+    binary = bin(bitmap)[:1:-1]
+    values = []
+    i = binary.find("1")
+    while i != -1:
+        values.append(i)
+        i = binary.find("1", i + 1)
+    return values
+
+def chunk_from_values(lows):
+    lows = sorted(set(lows))
+    if len(lows) > ARRAY_LIMIT:
+        bits = bytearray(BITMAP_BYTES)
+        for low in lows:
+            bits[low >> 3] |= 1 << (low & 7)
+        return bits
+    return array.array("H", lows)
+
+def chunk_contains(container, low):
+    if isinstance(container, bytearray):
+        return container[low >> 3] >> (low & 7) & 1 == 1
+    i = bisect.bisect_left(container, low)
+    return i < len(container) and container[i] == low
+
+def chunk_len(container):
+    if isinstance(container, bytearray):
+        return int.from_bytes(container, "little").bit_count()
+    return len(container)
+
+def combine_chunks(a, b, op):
+    # op is "|", "&", "-" or "^"; a or b may be None (empty chunk)
+    if a is None or b is None:
+        if op == "&" or a is None and op == "-":
+            return None
+        # Copy, so changing the result does not change the operand it came from
+        chunk = a if b is None else b
+        return bytearray(chunk) if isinstance(chunk, bytearray) else array.array("H", chunk)
+    if not isinstance(a, bytearray) and not isinstance(b, bytearray):
+        x, y = set(a), set(b)
+        values = x | y if op == "|" else x & y if op == "&" else x - y if op == "-" else x ^ y
+        return chunk_from_values(values) if values else None
+    if op == "&" and not isinstance(a, bytearray):
+        values = [low for low in a if b[low >> 3] >> (low & 7) & 1]
+        return array.array("H", values) if values else None
+    x, y = chunk_to_int(a), chunk_to_int(b)
+    return chunk_from_int(x | y if op == "|" else x & y if op == "&" else x & ~y if op == "-" else x ^ y)
+
+class IntSet:
+    def __init__(self, values=()):
+        self.chunks = {}  # value >> 16 -> array('H') or bytearray bitmap
+        groups = {}
+        for value in values:
+            if value < 0:
+                raise ValueError("IntSet only holds non-negative integers")
+            groups.setdefault(value >> 16, []).append(value & 0xFFFF)
+        for high, lows in groups.items():
+            self.chunks[high] = chunk_from_values(lows)
+
+    @classmethod
+    def _from_chunks(cls, chunks):
+        result = cls()
+        result.chunks = chunks
+        return result
+
+    @staticmethod
+    def _coerce(other):
+        return other if isinstance(other, IntSet) else IntSet(other)
+
+    def add(self, value):
+        if value < 0:
+            raise ValueError("IntSet only holds non-negative integers")
+        high, low = value >> 16, value & 0xFFFF
+        container = self.chunks.get(high)
+        if container is None:
+            self.chunks[high] = array.array("H", [low])
+        elif isinstance(container, bytearray):
+            container[low >> 3] |= 1 << (low & 7)
+        else:
+            i = bisect.bisect_left(container, low)
+            if i == len(container) or container[i] != low:
+                container.insert(i, low)
+                if len(container) > ARRAY_LIMIT:
+                    self.chunks[high] = chunk_from_values(container)
+
+    def discard(self, value):
+        high, low = value >> 16, value & 0xFFFF
+        container = self.chunks.get(high)
+        if container is None or value < 0:
+            return
+        if isinstance(container, bytearray):
+            container[low >> 3] &= ~(1 << (low & 7)) & 0xFF
+            if not any(container):
+                del self.chunks[high]
+        else:
+            i = bisect.bisect_left(container, low)
+            if i < len(container) and container[i] == low:
+                del container[i]
+                if not container:
+                    del self.chunks[high]
+
+    def remove(self, value):
+        if value not in self:
+            raise KeyError(value)
+        self.discard(value)
+
+    def _combine(self, other, op):
+        other = self._coerce(other)
+        chunks = {}
+        for high in self.chunks.keys() | other.chunks.keys():
+            container = combine_chunks(self.chunks.get(high), other.chunks.get(high), op)
+            if container is not None:
+                chunks[high] = container
+        return IntSet._from_chunks(chunks)
+
+    def union(self, other):
+        return self._combine(other, "|")
+
+    def intersection(self, other):
+        return self._combine(other, "&")
+
+    def difference(self, other):
+        return self._combine(other, "-")
+
+    def symmetric_difference(self, other):
+        return self._combine(other, "^")
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+    __xor__ = symmetric_difference
+
+    def issubset(self, other):
+        other = self._coerce(other)
+        return all(
+            high in other.chunks and combine_chunks(container, other.chunks[high], "-") is None
+            for high, container in self.chunks.items()
+        )
+
+    def issuperset(self, other):
+        return self._coerce(other).issubset(self)
+
+    __le__ = issubset
+    __ge__ = issuperset
+
+    def __eq__(self, other):
+        if not isinstance(other, IntSet):
+            return NotImplemented
+        return self.chunks.keys() == other.chunks.keys() and all(
+            chunk_to_int(container) == chunk_to_int(other.chunks[high]) for high, container in self.chunks.items()
+        )
+
+    def __contains__(self, value):
+        container = self.chunks.get(value >> 16) if value >= 0 else None
+        return container is not None and chunk_contains(container, value & 0xFFFF)
+
+    def __len__(self):
+        return sum(chunk_len(container) for container in self.chunks.values())
+
+    def __iter__(self):
+        for high in sorted(self.chunks):
+            container = self.chunks[high]
+            lows = bitmap_values(chunk_to_int(container)) if isinstance(container, bytearray) else container
+            base = high << 16
+            for low in lows:
+                yield base + low
+
+    def __repr__(self):
+        return f"IntSet({list(self)})" if len(self) <= 20 else f"IntSet(<{len(self)} values>)"
+
+    def to_bytes(self):
+        # Layout: b"ISET", chunk count, then per chunk: high bits, kind (0 = array, 1 = bitmap),
+        # value count for arrays, and the little-endian payload
+        parts = [b"ISET", struct.pack("<I", len(self.chunks))]
+        for high in sorted(self.chunks):
+            container = self.chunks[high]
+            if isinstance(container, bytearray):
+                parts.append(struct.pack("<QBI", high, 1, BITMAP_BYTES))
+                parts.append(bytes(container))
+            else:
+                payload = array.array("H", container)
+                if sys.byteorder == "big":
+                    payload.byteswap()
+                parts.append(struct.pack("<QBI", high, 0, len(payload)))
+                parts.append(payload.tobytes())
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data):
+        data = memoryview(data)
+        if data[:4] != b"ISET":
+            raise ValueError("not an IntSet serialisation")
+        (count,) = struct.unpack_from("<I", data, 4)
+        offset = 8
+        chunks = {}
+        for _ in range(count):
+            high, kind, length = struct.unpack_from("<QBI", data, offset)
+            offset += struct.calcsize("<QBI")
+            if kind == 1:
+                chunks[high] = bytearray(data[offset:offset + BITMAP_BYTES])
+                offset += BITMAP_BYTES
+            else:
+                container = array.array("H")
+                container.frombytes(data[offset:offset + 2 * length])
+                if sys.byteorder == "big":
+                    container.byteswap()
+                chunks[high] = container
+                offset += 2 * length
+        return cls._from_chunks(chunks)
+
+ids1 = IntSet([1, 2, 3, 4, 5])
+ids2 = IntSet([4, 5, 6, 7, 8])
+print(list(ids1 | ids2))  # [1, 2, 3, 4, 5, 6, 7, 8]
+print(list(ids1 & ids2))  # [4, 5]
+print(list(ids1 - ids2))  # [1, 2, 3]
+print(list(ids1 ^ ids2))  # [1, 2, 3, 6, 7, 8]
+print(IntSet.from_bytes(ids1.to_bytes()) == ids1)  # True
+
+# Benchmark: memory and operation time of IntSet against the builtin set
+import random
+import time
+import tracemalloc
+
+def benchmark_int_set(size=10 ** 6, universe=10 ** 7):
+    values1 = random.sample(range(universe), size)
+    values2 = random.sample(range(universe), size)
+    for label, kind in (("set", set), ("IntSet", IntSet)):
+        tracemalloc.start()
+        a = kind(values1)
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        b = kind(values2)
+        timings = []
+        for name in ("union", "intersection", "difference", "symmetric_difference"):
+            start = time.perf_counter()
+            getattr(a, name)(b)
+            timings.append(f"{name} {(time.perf_counter() - start) * 1000:.1f} ms")
+        print(f"{label}: {memory / size:.1f} bytes per value, " + ", ".join(timings))
+
+benchmark_int_set(size=10 ** 4, universe=10 ** 5)
+# benchmark_int_set()  # Full run on 10^6 IDs
+
 # 4. Data Analysis and Statistics
 # Sets are useful for data analysis tasks where you need to find unique items or perform set operations on datasets:
 # Finding unique words in a text
@@ -167,12 +618,212 @@ text = "hello world hello python world"
 unique_words = set(text.split())
 print(unique_words)  # {"hello", "world", "python"}
 
+# If only the number of distinct items is needed, keeping all of them in a set is wasteful.
+# HyperLogLog estimates the count from a fixed array of small registers:
+# o	Each item is hashed to 64 bits. The first `precision` bits pick a register, and the register
+#   keeps the longest run of leading zeros seen in the remaining bits (plus one).
+# o	Long runs of zeros are rare, so the registers together tell how many distinct hashes were seen.
+# o	Typical error is 1.04 / sqrt(number of registers), with one byte per register:
+#   precision 10 -> 1 KB of state, about 3.2% error; precision 14 -> 16 KB, about 0.8% error.
+# o	merge() takes the maximum of each register, so shards can be counted in separate
+#   processes and combined (HyperLogLog objects can be pickled or rebuilt from registers).
+class HyperLogLog:
+    def __init__(self, precision=14, registers=None):
+        if not 4 <= precision <= 18:
+            raise ValueError("precision must be between 4 and 18")
+        self.precision = precision
+        self.m = 1 << precision
+        self.registers = bytearray(registers) if registers is not None else bytearray(self.m)
+        if len(self.registers) != self.m:
+            raise ValueError(f"expected {self.m} registers, got {len(self.registers)}")
+
+    def add(self, item):
+        h = int.from_bytes(hashlib.blake2b(item_to_bytes(item), digest_size=8).digest(), "little")
+        index = h >> (64 - self.precision)
+        rest = h & ((1 << (64 - self.precision)) - 1)
+        rank = 64 - self.precision - rest.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def update(self, items):
+        for item in items:
+            self.add(item)
+
+    def count(self):
+        m = self.m
+        alpha = 0.7213 / (1 + 1.079 / m) if m >= 128 else {16: 0.673, 32: 0.697, 64: 0.709}[m]
+        estimate = alpha * m * m / sum(2.0 ** -register for register in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            # Few items: counting empty registers ("linear counting") is more accurate
+            estimate = m * math.log(m / zeros)
+        return round(estimate)
+
+    def merge(self, other):
+        if other.precision != self.precision:
+            raise ValueError("can only merge HyperLogLogs with the same precision")
+        self.registers = bytearray(map(max, self.registers, other.registers))
+        return self
+
+    def __len__(self):
+        return self.count()
+
+words_hll = HyperLogLog(precision=10)
+words_hll.update(text.split())
+print(words_hll.count())  # 3
+names_hll = HyperLogLog(precision=10)
+names_hll.update(["Alice", "Bob", "Alice", "Charlie", "Bob"])
+print(names_hll.merge(words_hll).count())  # 6
+
+# Benchmark: HyperLogLog at 1 KB and 16 KB of state against an exact set
+def benchmark_hyperloglog(size=10 ** 8, distinct=10 ** 7):
+    items = (f"item{i % distinct}" for i in range(size))
+    sketches = {precision: HyperLogLog(precision) for precision in (10, 14)}
+    exact = set()
+    start = time.perf_counter()
+    for item in items:
+        exact.add(item)
+        for sketch in sketches.values():
+            sketch.add(item)
+    print(f"{size} items in {time.perf_counter() - start:.1f}s, exact distinct {len(exact)} "
+          f"(set about {sys.getsizeof(exact) / 2 ** 20:.1f} MiB without the items)")
+    for precision, sketch in sketches.items():
+        estimate = sketch.count()
+        print(f"precision {precision} ({sketch.m / 1024:.0f} KB): {estimate}, error {abs(estimate - len(exact)) / len(exact):.2%}")
+
+benchmark_hyperloglog(size=10 ** 4, distinct=5000)
+# benchmark_hyperloglog()  # Full run on 10^8 items
+
 # 5. Handling Unordered Data
 # When the order of elements does not matter, sets can be used to efficiently manage and manipulate data without concern for sequence:
 # Managing unique tags associated with a blog post
 tags = {"python", "programming", "tutorial", "python"}
 print(tags)  # {"python", "programming", "tutorial"}
 
+# Finding all pairs of very similar tag sets among 10^5 posts by intersecting every pair would take
+# about 5 * 10^9 intersections. MinHash and LSH (locality-sensitive hashing) only compare likely pairs:
+# o	MinHash: every item is hashed with num_perm different hash functions, and the signature keeps
+#   the smallest value of each. Two sets agree on a signature position with probability equal to
+#   their Jaccard similarity, len(a & b) / len(a | b).
+# o	LSH: the signature is cut into bands of rows. Sets that agree on every row of at least one band
+#   land in the same bucket and become candidate pairs. The band size is chosen so that a pair
+#   exactly at the threshold shares a bucket with 95% probability (more similar pairs even more often).
+# o	Candidates are then checked with the exact intersection, so no false pairs are returned.
+# Signatures can be computed in a process pool (processes > 1).
+import functools
+import itertools
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+MERSENNE_PRIME = (1 << 61) - 1
+
+@functools.lru_cache(maxsize=None)
+def minhash_permutations(num_perm, seed):
+    rng = random.Random(seed)
+    return [(rng.randrange(1, MERSENNE_PRIME), rng.randrange(MERSENNE_PRIME)) for _ in range(num_perm)]
+
+def minhash_signature(items, num_perm=128, seed=1):
+    hashes = [int.from_bytes(hashlib.blake2b(item_to_bytes(item), digest_size=8).digest(), "little") for item in items]
+    if not hashes:
+        return (MERSENNE_PRIME,) * num_perm
+    return tuple(
+        min((a * h + b) % MERSENNE_PRIME for h in hashes)
+        for a, b in minhash_permutations(num_perm, seed)
+    )
+
+def minhash_signatures(sets, num_perm=128, seed=1, processes=1):
+    if processes > 1:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            return list(executor.map(
+                minhash_signature, sets, itertools.repeat(num_perm), itertools.repeat(seed), chunksize=256
+            ))
+    return [minhash_signature(items, num_perm, seed) for items in sets]
+
+def choose_bands(threshold, num_perm, recall=0.95):
+    # A pair with similarity s becomes a candidate with probability 1 - (1 - s ** rows) ** bands.
+    # Use the widest bands (fewest false candidates) that still catch a pair exactly at the threshold
+    # with probability recall.
+    best = (num_perm, 1)
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows == 0:
+            bands = num_perm // rows
+            if 1 - (1 - threshold ** rows) ** bands >= recall:
+                best = (bands, rows)
+    return best
+
+class LSHIndex:
+    def __init__(self, threshold=0.8, num_perm=128):
+        self.bands, self.rows = choose_bands(threshold, num_perm)
+        self.buckets = [{} for _ in range(self.bands)]  # per band: band values -> keys
+
+    def insert(self, key, signature):
+        for band, buckets in enumerate(self.buckets):
+            start = band * self.rows
+            buckets.setdefault(signature[start:start + self.rows], []).append(key)
+
+    def query(self, signature):
+        keys = set()
+        for band, buckets in enumerate(self.buckets):
+            start = band * self.rows
+            keys.update(buckets.get(signature[start:start + self.rows], ()))
+        return keys
+
+    def candidate_pairs(self):
+        pairs = set()
+        for buckets in self.buckets:
+            for keys in buckets.values():
+                if len(keys) > 1:
+                    pairs.update(itertools.combinations(sorted(keys), 2))
+        return pairs
+
+def jaccard(a, b):
+    union = len(a | b)
+    return len(a & b) / union if union else 1.0
+
+def similar_pairs(sets, threshold=0.8, num_perm=128, processes=1):
+    # sets: list of sets; returns (i, j, jaccard) for every pair found at or above threshold
+    sets = [set(items) for items in sets]
+    index = LSHIndex(threshold, num_perm)
+    for key, signature in enumerate(minhash_signatures(sets, num_perm, processes=processes)):
+        index.insert(key, signature)
+    results = []
+    for i, j in sorted(index.candidate_pairs()):
+        similarity = jaccard(sets[i], sets[j])
+        if similarity >= threshold:
+            results.append((i, j, similarity))
+    return results
+
+post_tags = [
+    {"python", "programming", "tutorial", "sets"},
+    {"python", "programming", "tutorial", "sets", "beginner"},
+    {"cooking", "pasta", "italian"},
+]
+print(similar_pairs(post_tags, threshold=0.7))  # [(0, 1, 0.8)]
+
+# Benchmark: LSH against intersecting every pair
+def benchmark_similar_pairs(size=10 ** 5, threshold=0.8, processes=1):
+    vocabulary = [f"tag{i}" for i in range(5000)]
+    sets = []
+    for i in range(size):
+        if sets and i % 10 == 0:
+            near = set(random.choice(sets))  # A near-duplicate of an earlier set
+            near.add(random.choice(vocabulary))
+            sets.append(near)
+        else:
+            sets.append(set(random.sample(vocabulary, 10)))
+    start = time.perf_counter()
+    found = similar_pairs(sets, threshold, processes=processes)
+    print(f"LSH: {len(found)} pairs in {time.perf_counter() - start:.2f}s")
+    if size <= 5000:
+        start = time.perf_counter()
+        exact = [(i, j) for i, j in itertools.combinations(range(size), 2) if jaccard(sets[i], sets[j]) >= threshold]
+        print(f"all pairs: {len(exact)} pairs in {time.perf_counter() - start:.2f}s")
+
+benchmark_similar_pairs(size=300)
+# Full run on 10^5 tag sets; the process pool needs the __main__ guard under "spawn" (macOS, Windows):
+# if __name__ == "__main__":
+#     benchmark_similar_pairs(processes=4)
+
 # 6. Checking for Subsets and Supersets
 # Sets allow for easy checking of subsets and supersets, which is helpful in many algorithmic and computational tasks:
 set1 = {1, 2, 3}
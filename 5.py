@@ -58,6 +58,137 @@ repeat = "Hi! " * 3  # 'Hi! Hi! Hi! '
 name = "World"
 f"Hello, {name}!"  # 'Hello, World!'
 
+# Formatting the same message shape millions of times
+# str.format() parses the format string again on every call. Template.compile() parses it once
+# into literal pieces and fields ("{0}", "{name}", "{user.name}", "{items[0]}", with !r/!s/!a
+# conversions and format specs like ":>10" or ":.2f"), and turns them into a small Python
+# function whose body is one f-string, the same way namedtuple and dataclasses generate code.
+# Literals, names and keys are passed to the generated code as default arguments (or through a
+# closure), so nothing from the format string is pasted into the code.
+# o	render(*args, **kwargs) works like str.format(). Its body is an f-string, but Python still packs
+#   the arguments into a new tuple and dict on every call, and that costs as much as the formatting:
+#   one call measured about the same as str.format() (1.3-1.6 us against 1.3-1.8 us).
+# o	format_map(mapping) works like str.format_map() but uses the mapping as it is: about 0.85 us
+#   against 1.25 us for str.format_map().
+# o	render_many() formats a batch of rows (dicts for named fields, tuples for positional ones) at the
+#   same per-row cost as format_map.
+import functools
+import keyword
+import re
+import string
+
+SIMPLE_FORMAT_SPEC = re.compile(r"[\w<>=^+\- #,.%]*")
+
+class Template:
+    def __init__(self, fmt, source, namespace):
+        self.fmt = fmt
+        self.source = source  # The generated code, handy for debugging
+        self._render = namespace["render"]
+        self.render = namespace["render_direct"]  # Called as render(*args, **kwargs), no wrapper in between
+        self.format_map = functools.partial(self._render, ())
+
+    @classmethod
+    def compile(cls, fmt):
+        constants = {}
+
+        def constant(value):
+            name = f"_c{len(constants)}"
+            constants[name] = value
+            return name
+
+        body = []
+        auto_index = 0
+        numbering = None  # "auto" for "{}", "manual" for "{0}"; mixing them is an error, like str.format
+        for literal, field_name, format_spec, conversion in string.Formatter().parse(fmt):
+            if literal:
+                body.append("{%s}" % constant(literal))
+            if field_name is None:
+                continue
+            if field_name == "" or field_name[0] in ".[":
+                if numbering == "manual":
+                    raise ValueError("cannot switch from manual field numbering to automatic")
+                numbering = "auto"
+                field_name = f"{auto_index}{field_name}"
+                auto_index += 1
+            elif field_name[0].isdigit():
+                if numbering == "auto":
+                    raise ValueError("cannot switch from automatic field numbering to manual")
+                numbering = "manual"
+            body.append("{%s}" % cls._field_code(field_name, conversion, format_spec or "", constant))
+        params = "".join(f", {name}={name}" for name in constants)
+        # render_direct gets the constants through a closure: as keyword defaults, a kwarg named _c0 would replace them
+        source = (f'def render(args, kwargs{params}):\n    return f"{"".join(body)}"\n'
+                  f'def make_render_direct({", ".join(constants)}):\n'
+                  f'    def render_direct(*args, **kwargs):\n        return f"{"".join(body)}"\n'
+                  f'    return render_direct\n')
+        namespace = dict(constants)
+        exec(source, namespace)
+        namespace["render_direct"] = namespace["make_render_direct"](**constants)
+        return cls(fmt, source, namespace)
+
+    @staticmethod
+    def _field_code(field_name, conversion, format_spec, constant):
+        # Python source for one field, e.g. "kwargs[_c1].name!r:>10"
+        first = re.match(r"[^.\[]*", field_name).group()
+        code = f"args[{int(first)}]" if first.isdigit() else f"kwargs[{constant(first)}]"
+        rest = field_name[len(first):]
+        position = 0
+        for step in re.finditer(r"\.([^.\[]+)|\[([^\]]+)\]", rest):
+            if step.start() != position:
+                raise ValueError(f"invalid field name {field_name!r}")
+            position = step.end()
+            attribute, key = step.groups()
+            if attribute is None:
+                code = f"{code}[{int(key)}]" if key.isdigit() else f"{code}[{constant(key)}]"
+            elif attribute.isidentifier() and not keyword.iskeyword(attribute):
+                code = f"{code}.{attribute}"
+            else:
+                code = f"getattr({code}, {constant(attribute)})"
+        if position != len(rest):
+            raise ValueError(f"invalid field name {field_name!r}")
+        if conversion is not None:
+            if conversion not in ("r", "s", "a"):
+                raise ValueError(f"unknown conversion {conversion!r}")
+            code += "!" + conversion
+        if "{" in format_spec:
+            raise ValueError("nested fields in format specs are not supported")
+        if format_spec:
+            spec = format_spec if SIMPLE_FORMAT_SPEC.fullmatch(format_spec) else "{%s}" % constant(format_spec)
+            code += ":" + spec
+        return code
+
+    def render_many(self, rows):
+        render = self._render
+        no_args, no_kwargs = (), {}
+        return [render(no_args, row) if isinstance(row, dict) else render(row, no_kwargs) for row in rows]
+
+greeting = Template.compile("Hello, {name}! You have {count:>3} new messages.")
+print(greeting.render(name="World", count=5))  # 'Hello, World! You have   5 new messages.'
+print(Template.compile("{0} + {0} = {1:.1f}").render_many([(1, 2), (2, 4)]))  # ['1 + 1 = 2.0', '2 + 2 = 4.0']
+
+# Benchmark: Template against %, str.format() and f-strings for the same message
+import time
+
+def benchmark_templates(size=10 ** 6):
+    rows = [{"user": f"user{i}", "action": "login", "ms": i % 1000 / 7} for i in range(size)]
+    template = Template.compile("{user} did {action} in {ms:.2f} ms")
+    fmt = "{user} did {action} in {ms:.2f} ms"
+    for label, render in (
+        ("%", lambda: ["%s did %s in %.2f ms" % (r["user"], r["action"], r["ms"]) for r in rows]),
+        ("str.format", lambda: [fmt.format(**r) for r in rows]),
+        ("f-string", lambda: [f"{r['user']} did {r['action']} in {r['ms']:.2f} ms" for r in rows]),
+        ("Template.render", lambda: [template.render(**r) for r in rows]),
+        ("str.format_map", lambda: [fmt.format_map(r) for r in rows]),
+        ("Template.format_map", lambda: [template.format_map(r) for r in rows]),
+        ("Template.render_many", lambda: template.render_many(rows)),
+    ):
+        start = time.perf_counter()
+        render()
+        print(f"{label}: {(time.perf_counter() - start) / size * 1e9:.0f} ns per message")
+
+benchmark_templates(size=10 ** 4)
+# benchmark_templates()  # Full run on 10^6 messages
+
 # 6. Escape Characters
 # Special characters can be included in strings using backslashes:
 # \n: New line
@@ -73,6 +204,114 @@ print("Line 1\nLine 2")
 # in: Checks if a substring exists in the string.
 "world" in "hello world"  # True
 
+# Searching for many keywords at once
+# Checking a line for thousands of keywords with find() or "in" scans the line once per keyword.
+# An Aho-Corasick automaton compiles all keywords into one trie with "failure links" (where to
+# continue when the next character doesn't match), then finds every occurrence of every keyword
+# in a single pass over the text. Works on str (with str keywords) or bytes (with bytes keywords).
+# stream() keeps the automaton's position between chunks, so matches that cross a chunk
+# boundary are still found, with offsets counted from the start of the whole stream.
+from collections import deque
+
+class AhoCorasick:
+    def __init__(self, patterns):
+        self.patterns = tuple(patterns)
+        if not all(self.patterns):
+            raise ValueError("patterns must be non-empty")
+        self.goto = [{}]  # node -> {character: next node}
+        self.outputs = [()]  # node -> indexes of the patterns ending here (including via failure links)
+        for index, pattern in enumerate(self.patterns):
+            node = 0
+            for char in pattern:
+                next_node = self.goto[node].get(char)
+                if next_node is None:
+                    next_node = len(self.goto)
+                    self.goto[node][char] = next_node
+                    self.goto.append({})
+                    self.outputs.append(())
+                node = next_node
+            self.outputs[node] += (index,)
+        # Breadth-first, so a node's failure target (always shallower) is finished before the node
+        self.fail = [0] * len(self.goto)
+        queue = deque(self.goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self.goto[node].items():
+                queue.append(child)
+                target = self.fail[node]
+                while target and char not in self.goto[target]:
+                    target = self.fail[target]
+                self.fail[child] = self.goto[target].get(char, 0) if node else 0
+                self.outputs[child] += self.outputs[self.fail[child]]
+
+    def _scan(self, text, node, offset):
+        # Yields (start, pattern) matches and finally the automaton node reached
+        goto, fail, outputs, patterns = self.goto, self.fail, self.outputs, self.patterns
+        for i, char in enumerate(text, offset):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if outputs[node]:
+                for index in outputs[node]:
+                    yield i - len(patterns[index]) + 1, patterns[index]
+        yield node
+
+    def find_all(self, text):
+        # Returns (start, pattern) for every occurrence, ordered by where the match ends
+        *matches, _ = self._scan(text, 0, 0)
+        return matches
+
+    def stream(self):
+        return AhoCorasickStream(self)
+
+class AhoCorasickStream:
+    def __init__(self, automaton):
+        self.automaton = automaton
+        self.node = 0
+        self.offset = 0
+
+    def feed(self, chunk):
+        *matches, self.node = self.automaton._scan(chunk, self.node, self.offset)
+        self.offset += len(chunk)
+        return matches
+
+keywords = AhoCorasick(["he", "she", "his", "hers"])
+print(keywords.find_all("ushers"))  # [(1, 'she'), (2, 'he'), (2, 'hers')]
+log_stream = AhoCorasick([b"ERROR", b"timeout"]).stream()
+print(log_stream.feed(b"request tim") + log_stream.feed(b"eout, ERROR"))  # [(8, b'timeout'), (17, b'ERROR')]
+
+# Benchmark: one Aho-Corasick pass against a str.find() loop per keyword
+import random
+import string
+import time
+
+def find_all_with_loop(text, patterns):
+    matches = []
+    for pattern in patterns:
+        start = text.find(pattern)
+        while start != -1:
+            matches.append((start, pattern))
+            start = text.find(pattern, start + 1)
+    return matches
+
+def benchmark_keyword_search(pattern_counts=(1000, 10000), lines=1000):
+    words = ["".join(random.choices(string.ascii_lowercase, k=random.randint(4, 10))) for _ in range(50000)]
+    log_lines = [" ".join(random.choices(words, k=20)) for _ in range(lines)]
+    for count in pattern_counts:
+        patterns = random.sample(words, count)
+        automaton = AhoCorasick(patterns)
+        for label, search in (
+            ("Aho-Corasick", automaton.find_all),
+            ("str.find loop", lambda line: find_all_with_loop(line, patterns)),
+        ):
+            start = time.perf_counter()
+            for line in log_lines:
+                search(line)
+            print(f"{count} patterns, {label}: {(time.perf_counter() - start) / lines * 1e6:.1f} us per line")
+
+benchmark_keyword_search(pattern_counts=(100, 1000), lines=100)
+# benchmark_keyword_search()  # Full run with 1k and 10k patterns
+
 # 8. Case Conversion
 # capitalize(): Capitalizes the first letter.
 "hello".capitalize()  # 'Hello'
@@ -86,4 +325,244 @@ print("Line 1\nLine 2")
 # 9. String Immutability
 # Strings in Python are immutable, which means once created, they cannot be changed. Any operation that modifies a string will return a new string.
 my_string = "Hello"
-new_string = my_string.replace("H", "J")  # 'Jello'
\ No newline at end of file
+new_string = my_string.replace("H", "J")  # 'Jello'
+
+# Building and editing large texts
+# Because strings are immutable, "report += line" may copy the whole report every time, and
+# editing the middle of a big text with text[:i] + piece + text[i:] always copies all of it.
+# o	StringBuilder collects the pieces in a list and joins them once, when the text is needed.
+# o	Rope stores a large text as a balanced tree of short strings (an AVL tree whose leaves are
+#   str pieces up to ROPE_LEAF_SIZE characters). Inserting, deleting or slicing only rebuilds
+#   the O(log n) nodes along one path instead of copying the whole text.
+class StringBuilder:
+    def __init__(self, text=""):
+        self.parts = [text] if text else []
+        self.length = len(text)
+
+    def append(self, text):
+        self.parts.append(text)
+        self.length += len(text)
+        return self
+
+    def extend(self, texts):
+        for text in texts:
+            self.append(text)
+        return self
+
+    write = append  # Lets a StringBuilder stand in for a file with print(..., file=builder)
+
+    def build(self):
+        text = "".join(self.parts)
+        self.parts = [text] if text else []  # Later builds don't re-join the same pieces
+        return text
+
+    __str__ = build
+
+    def __len__(self):
+        return self.length
+
+ROPE_LEAF_SIZE = 512
+
+class RopeNode:
+    __slots__ = ("left", "right", "length", "height")
+
+    def __init__(self, left, right):
+        self.left = left
+        self.right = right
+        self.length = len(left) + len(right)
+        self.height = max(rope_height(left), rope_height(right)) + 1
+
+    def __len__(self):
+        return self.length
+
+def rope_height(node):
+    return 0 if node.__class__ is str else node.height
+
+def rope_rotate_left(node):
+    right = node.right
+    return RopeNode(RopeNode(node.left, right.left), right.right)
+
+def rope_rotate_right(node):
+    left = node.left
+    return RopeNode(left.left, RopeNode(left.right, node.right))
+
+def rope_join_right(a, b):
+    # a is more than one level taller than b: attach b along a's right spine (AVL join)
+    left, middle = a.left, a.right
+    if rope_height(middle) <= rope_height(b) + 1:
+        joined = rope_join(middle, b)
+        if rope_height(joined) <= rope_height(left) + 1:
+            return RopeNode(left, joined)
+        return rope_rotate_left(RopeNode(left, rope_rotate_right(joined)))
+    joined = rope_join_right(middle, b)
+    node = RopeNode(left, joined)
+    return node if rope_height(joined) <= rope_height(left) + 1 else rope_rotate_left(node)
+
+def rope_join_left(a, b):
+    # Mirror image of rope_join_right, for b more than one level taller than a
+    middle, right = b.left, b.right
+    if rope_height(middle) <= rope_height(a) + 1:
+        joined = rope_join(a, middle)
+        if rope_height(joined) <= rope_height(right) + 1:
+            return RopeNode(joined, right)
+        return rope_rotate_right(RopeNode(rope_rotate_left(joined), right))
+    joined = rope_join_left(a, middle)
+    node = RopeNode(joined, right)
+    return node if rope_height(joined) <= rope_height(right) + 1 else rope_rotate_right(node)
+
+def rope_join(a, b):
+    if not len(a):
+        return b
+    if not len(b):
+        return a
+    if a.__class__ is str and b.__class__ is str and len(a) + len(b) <= ROPE_LEAF_SIZE:
+        return a + b
+    height_a, height_b = rope_height(a), rope_height(b)
+    if height_a > height_b + 1:
+        return rope_join_right(a, b)
+    if height_b > height_a + 1:
+        return rope_join_left(a, b)
+    return RopeNode(a, b)
+
+def rope_split(node, i):
+    # Returns (first i characters, the rest) as two ropes
+    if node.__class__ is str:
+        return node[:i], node[i:]
+    if i <= len(node.left):
+        left, right = rope_split(node.left, i)
+        return left, rope_join(right, node.right)
+    left, right = rope_split(node.right, i - len(node.left))
+    return rope_join(node.left, left), right
+
+def rope_from_text(text):
+    # Builds a balanced tree from ROPE_LEAF_SIZE pieces by splitting the piece list in halves
+    pieces = [text[i:i + ROPE_LEAF_SIZE] for i in range(0, len(text), ROPE_LEAF_SIZE)] or [""]
+
+    def build(low, high):
+        if high - low == 1:
+            return pieces[low]
+        middle = (low + high) // 2
+        return RopeNode(build(low, middle), build(middle, high))
+
+    return build(0, len(pieces))
+
+class Rope:
+    def __init__(self, text=""):
+        self.root = text if isinstance(text, RopeNode) else rope_from_text(text)
+
+    def __len__(self):
+        return len(self.root)
+
+    def _index(self, i):
+        length = len(self.root)
+        if i < 0:
+            i += length
+        return max(0, min(i, length))
+
+    def insert(self, i, text):
+        left, right = rope_split(self.root, self._index(i))
+        self.root = rope_join(rope_join(left, rope_from_text(text)), right)
+
+    def append(self, text):
+        self.root = rope_join(self.root, rope_from_text(text))
+
+    def delete(self, start, end):
+        start, end = self._index(start), self._index(end)
+        if start < end:
+            left, rest = rope_split(self.root, start)
+            _, right = rope_split(rest, end - start)
+            self.root = rope_join(left, right)
+
+    def slice(self, start, end):
+        # The characters start:end as a new Rope, without copying the whole text
+        start, end = self._index(start), self._index(end)
+        _, rest = rope_split(self.root, start)
+        middle, _ = rope_split(rest, max(0, end - start))
+        return Rope(middle) if middle.__class__ is RopeNode else Rope(str(middle))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return str(self)[index]
+            return "".join(self._pieces(self.slice(start, stop).root))
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("rope index out of range")
+        node = self.root
+        while node.__class__ is not str:
+            if index < len(node.left):
+                node = node.left
+            else:
+                index -= len(node.left)
+                node = node.right
+        return node[index]
+
+    @staticmethod
+    def _pieces(node):
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if node.__class__ is str:
+                yield node
+            else:
+                stack.append(node.right)
+                stack.append(node.left)
+
+    def __str__(self):
+        return "".join(self._pieces(self.root))
+
+report = StringBuilder()
+for line in ("Report", "------", "All systems normal"):
+    report.append(line).append("\n")
+print(report.build())
+
+document = Rope("Hello World!")
+document.insert(5, ",")
+document.insert(6, " big")
+print(str(document), document[0:5], document[-1])  # Hello, big World! Hello !
+
+# Benchmark: building a large text piece by piece, and editing it in the middle.
+# CPython can often grow a string in place when nothing else refers to it, so a simple += loop
+# is not always quadratic; StringBuilder is linear regardless of other references or interpreter.
+import io
+
+def sum_with_plus(words):
+    text = ""
+    for word in words:
+        text = text + word
+    return text
+
+def write_to_string_io(words):
+    buffer = io.StringIO()
+    for word in words:
+        buffer.write(word)
+    return buffer.getvalue()
+
+def benchmark_text_building(pieces=10 ** 6, edits=10 ** 4):
+    words = [f"line {i}\n" for i in range(pieces)]
+    for label, build in (
+        ("+ concatenation", lambda: sum_with_plus(words)),
+        ("StringBuilder", lambda: StringBuilder().extend(words).build()),
+        ("io.StringIO", lambda: write_to_string_io(words)),
+    ):
+        start = time.perf_counter()
+        text = build()
+        print(f"build {len(text) / 2 ** 20:.1f} MB with {label}: {time.perf_counter() - start:.2f}s")
+
+    positions = [random.randint(0, len(text)) for _ in range(edits)]
+    start = time.perf_counter()
+    edited = text
+    for i in positions:
+        edited = edited[:i] + "EDIT" + edited[i:]
+    print(f"{edits} inserts with slicing: {time.perf_counter() - start:.2f}s")
+    start = time.perf_counter()
+    rope = Rope(text)
+    for i in positions:
+        rope.insert(i, "EDIT")
+    print(f"{edits} inserts with Rope: {time.perf_counter() - start:.2f}s")
+
+benchmark_text_building(pieces=10 ** 4, edits=100)
+# benchmark_text_building()  # Full run: about 12 MB of text and 10^4 edits
@@ -49,6 +49,67 @@ with open('file.bin', 'rb') as file:
 with open('output.bin', 'wb') as file:
     file.write(data)
 
+# Copying or transforming large binary files in chunks
+# Reading the whole file and writing it back needs as much memory as the file is big.
+# copy_transform() reuses one preallocated bytearray: readinto() fills it without creating a
+# new bytes object, and fn receives a memoryview of the filled part (no copy). fn returns the
+# bytes to write; it may also change the chunk in place and return it. Memory use stays at
+# chunk_size no matter how big the file is.
+# Without fn (a plain copy) the data doesn't pass through Python at all: the kernel copies it
+# with os.copy_file_range() or os.sendfile() where available.
+import os
+import stat
+
+def copy_transform(src, dst, fn=None, chunk_size=1 << 20):
+    with open(src, 'rb') as source, open(dst, 'wb') as target:
+        if fn is None:
+            if copy_in_kernel(source, target):
+                return
+            # Start over in Python if the kernel copied only part of the file
+            source.seek(0)
+            target.seek(0)
+            target.truncate()
+        buffer = bytearray(chunk_size)
+        view = memoryview(buffer)
+        while True:
+            n = source.readinto(buffer)
+            if not n:
+                break
+            chunk = view[:n]
+            target.write(chunk if fn is None else fn(chunk))
+
+def copy_in_kernel(source, target):
+    # Returns False if neither system call is available or usable for these files. Only regular
+    # files are tried: /proc files, pipes and devices report size 0 however much they contain.
+    info = os.fstat(source.fileno())
+    if not stat.S_ISREG(info.st_mode) or not info.st_size:
+        return False
+    size = info.st_size
+    for copy in (getattr(os, 'copy_file_range', None), getattr(os, 'sendfile', None)):
+        if copy is None:
+            continue
+        copied = 0
+        try:
+            while copied < size:
+                if copy is os.sendfile:
+                    n = copy(target.fileno(), source.fileno(), copied, size - copied)
+                else:
+                    n = copy(source.fileno(), target.fileno(), size - copied, copied, copied)
+                if not n:
+                    break
+                copied += n
+        except OSError:
+            if copied:
+                raise
+            continue  # Not supported for this pair of files, try the next way
+        return copied == size
+    return False
+
+# Example: copy file.bin to output.bin, then write an inverted copy (every byte XOR 0xFF)
+copy_transform('file.bin', 'output.bin')
+INVERT = bytes(255 - i for i in range(256))
+copy_transform('file.bin', 'inverted.bin', lambda chunk: chunk.tobytes().translate(INVERT))
+
 # 5. Common Methods for Byte Arrays
 # Byte arrays have several useful methods:
 # append(x): Appends a single byte (integer) to the byte array.
@@ -89,16 +150,248 @@ byte_list = list(bytearray(b"Hello"))  # [72, 101, 108, 108, 111]
 # Convert a list of integers to a bytearray:
 arr = bytearray([72, 101, 108, 108, 111])
 
+# Memory-mapped binary files
+# bytearray(file.read()) reads the whole file into memory and then copies it once more into the
+# bytearray. With mmap the operating system maps the file into memory instead: pages are only
+# loaded when they are touched, and they are shared with the OS file cache.
+# BinaryFile wraps a mapping in a memoryview, so:
+# o	bf[10:20] returns a memoryview slice of the file, no bytes are copied.
+# o	bf[0] = 0 (in "r+" mode) writes straight into the file's pages, no read and rewrite of the whole file.
+# o	close() (or leaving the with block) closes the file even if slices are still alive; those slices
+#   keep working until they are released, then the mapping goes away with them.
+import mmap
+import os
+
+class BinaryFile:
+    def __init__(self, path, mode="r"):
+        if mode not in ("r", "r+"):
+            raise ValueError("mode must be 'r' or 'r+'")
+        self.file = open(path, "rb" if mode == "r" else "r+b")
+        size = os.fstat(self.file.fileno()).st_size
+        if size:
+            access = mmap.ACCESS_READ if mode == "r" else mmap.ACCESS_WRITE
+            self.mapping = mmap.mmap(self.file.fileno(), 0, access=access)
+            self.view = memoryview(self.mapping)
+        else:
+            # An empty file can't be mapped
+            self.mapping = None
+            self.view = memoryview(b"")
+
+    def __len__(self):
+        return len(self.view)
+
+    def __getitem__(self, index):
+        return self.view[index]
+
+    def __setitem__(self, index, value):
+        self.view[index] = value
+
+    def flush(self):
+        if self.mapping is not None and not self.view.readonly:
+            self.mapping.flush()
+
+    def close(self):
+        if self.file.closed:
+            return
+        try:
+            self.flush()
+            self.view.release()
+            if self.mapping is not None:
+                try:
+                    self.mapping.close()
+                except BufferError:
+                    # A slice from bf[a:b] is still in use. It stays valid, and the mapping is
+                    # unmapped once the last slice is released or garbage collected
+                    pass
+                self.mapping = None
+        finally:
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
 # Example: Manipulating an Image File as a Byte Array
-# Reading an image file as bytes
-with open('image.jpg', 'rb') as image_file:
-    img_data = bytearray(image_file.read())
+# Copy the image (shutil uses the OS's fast copy) and patch the copy through a mapping
+import shutil
+
+shutil.copyfile('image.jpg', 'image_modified.jpg')
+with BinaryFile('image_modified.jpg', 'r+') as img_data:
+    header = bytes(img_data[:2])  # Inspect the bytes, only this slice is copied
+    img_data[0] = 0  # Change the first byte, written straight to the file
+
+# Benchmark: peak memory and time of bytearray(file.read()) against BinaryFile on a large file.
+# Each variant runs in a fresh worker process so its peak RSS can be measured separately.
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+def peak_rss_mib():
+    import resource  # Unix only, so it is imported in the worker that measures
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2 ** 20 if sys.platform == "darwin" else peak / 2 ** 10  # Bytes on macOS, KiB on Linux
+
+def patch_with_read(path):
+    start = time.perf_counter()
+    with open(path, 'rb') as file:
+        data = bytearray(file.read())
+    data[0] = 0
+    with open(path, 'wb') as file:
+        file.write(data)
+    return time.perf_counter() - start, peak_rss_mib()
+
+def patch_with_mmap(path):
+    start = time.perf_counter()
+    with BinaryFile(path, 'r+') as data:
+        data[0] = 0
+    return time.perf_counter() - start, peak_rss_mib()
+
+def benchmark_binary_file(size=4 * 2 ** 30):
+    if sys.platform == "win32":
+        print("benchmark_binary_file needs the resource module (Unix only)")
+        return
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'large.bin')
+        with open(path, 'wb') as file:
+            block = os.urandom(2 ** 20)
+            for _ in range(size // len(block)):
+                file.write(block)
+        for label, patch in (("bytearray(file.read())", patch_with_read), ("BinaryFile", patch_with_mmap)):
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                seconds, peak_mib = executor.submit(patch, path).result()
+            print(f"{label}: {seconds:.3f}s, peak RSS {peak_mib:.0f} MiB")
+
+# The worker processes re-import this file under "spawn" (macOS, Windows), hence the __main__ guard
+if __name__ == "__main__":
+    benchmark_binary_file(size=4 * 2 ** 20)
+    # benchmark_binary_file()  # Full run on a 4 GB file
+
+# Benchmark: throughput and peak Python memory of copy_transform against reading everything at once
+import tracemalloc
+
+def copy_with_read(src, dst, fn=None):
+    with open(src, 'rb') as file:
+        data = bytearray(file.read())
+    with open(dst, 'wb') as file:
+        file.write(data if fn is None else fn(memoryview(data)))
+
+def benchmark_copy_transform(size=2 ** 30):
+    with tempfile.TemporaryDirectory() as directory:
+        src, dst = os.path.join(directory, 'src.bin'), os.path.join(directory, 'dst.bin')
+        with open(src, 'wb') as file:
+            block = os.urandom(2 ** 20)
+            for _ in range(size // len(block)):
+                file.write(block)
+        invert = lambda chunk: chunk.tobytes().translate(INVERT)
+        for label, copy in (
+            ("read everything, copy", lambda: copy_with_read(src, dst)),
+            ("copy_transform, copy", lambda: copy_transform(src, dst)),
+            ("read everything, invert", lambda: copy_with_read(src, dst, invert)),
+            ("copy_transform, invert", lambda: copy_transform(src, dst, invert)),
+        ):
+            tracemalloc.start()
+            start = time.perf_counter()
+            copy()
+            seconds = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"{label}: {size / seconds / 2 ** 20:.0f} MB/s, peak Python memory {peak / 2 ** 20:.1f} MiB")
+
+benchmark_copy_transform(size=4 * 2 ** 20)
+# benchmark_copy_transform()  # Full run on a 1 GB file
+
+# Binary records with struct
+# Binary protocols usually send fixed-layout records: e.g. a 4-byte id, an 8-byte float and a flag.
+# RecordCodec describes such a layout once, as (field name, struct format) pairs, and compiles it
+# into a struct.Struct:
+# o	pack_into() writes one record into an existing bytearray at an offset.
+# o	iter_unpack() reads records from a memoryview without copying the buffer.
+# o	encode_many() packs a whole batch into one preallocated bytearray, up to BATCH records per
+#   struct call (the layout repeated BATCH times), so no bytes object is created per record.
+# o	decode_many() unpacks a buffer into a list of tuples (or Record namedtuples).
+from collections import namedtuple
+import itertools
+import struct
+
+class RecordCodec:
+    BATCH = 1024
+
+    def __init__(self, fields, byteorder="<"):
+        # fields: [("id", "I"), ("price", "d"), ("name", "16s"), ...]
+        self.names = [name for name, _ in fields]
+        self.layout = "".join(code for _, code in fields)
+        if struct.calcsize(byteorder + self.layout * 2) != 2 * struct.calcsize(byteorder + self.layout):
+            # Native alignment ("@") pads between repeated records; pad each record like a C array does
+            self.layout += next(f"{pad}x" for pad in range(1, 16) if struct.calcsize(
+                byteorder + (self.layout + f"{pad}x") * 2) == 2 * struct.calcsize(byteorder + self.layout + f"{pad}x"))
+        self.byteorder = byteorder
+        self.struct = struct.Struct(byteorder + self.layout)
+        self.size = self.struct.size
+        self.batch_struct = struct.Struct(byteorder + self.layout * self.BATCH)
+        self.Record = namedtuple("Record", self.names)
+
+    def pack(self, record):
+        return self.struct.pack(*record)
+
+    def pack_into(self, buffer, offset, record):
+        self.struct.pack_into(buffer, offset, *record)
+
+    def unpack(self, buffer, offset=0):
+        return self.struct.unpack_from(buffer, offset)
+
+    def iter_unpack(self, buffer):
+        return self.struct.iter_unpack(memoryview(buffer))
+
+    def encode_many(self, records):
+        records = records if isinstance(records, (list, tuple)) else list(records)
+        buffer = bytearray(len(records) * self.size)
+        offset = 0
+        full = len(records) - len(records) % self.BATCH
+        for start in range(0, full, self.BATCH):
+            values = itertools.chain.from_iterable(records[start:start + self.BATCH])
+            self.batch_struct.pack_into(buffer, offset, *values)
+            offset += self.batch_struct.size
+        for record in records[full:]:
+            self.struct.pack_into(buffer, offset, *record)
+            offset += self.size
+        return buffer
+
+    def decode_many(self, buffer, as_records=False):
+        if len(buffer) % self.size:
+            raise ValueError(f"buffer length {len(buffer)} is not a multiple of the record size {self.size}")
+        records = list(self.struct.iter_unpack(memoryview(buffer)))
+        if as_records:
+            make = self.Record._make
+            return [make(record) for record in records]
+        return records
+
+trade_codec = RecordCodec([("id", "I"), ("price", "d"), ("buy", "?")])
+packet = trade_codec.encode_many([(1, 10.5, True), (2, 99.25, False)])
+print(len(packet), trade_codec.decode_many(packet, as_records=True))
+# 26 [Record(id=1, price=10.5, buy=True), Record(id=2, price=99.25, buy=False)]
+
+# Benchmark: RecordCodec against json and pickle
+import json
+import pickle
 
-# Modify or inspect the bytes
-img_data[0] = 0  # Change the first byte
+def benchmark_record_codec(size=10 ** 6):
+    records = [(i, i * 0.5, i % 2 == 0) for i in range(size)]
+    for label, encode, decode in (
+        ("RecordCodec", trade_codec.encode_many, trade_codec.decode_many),
+        ("json", lambda r: json.dumps(r).encode(), lambda b: json.loads(b)),
+        ("pickle", pickle.dumps, pickle.loads),
+    ):
+        start = time.perf_counter()
+        encoded = encode(records)
+        middle = time.perf_counter()
+        decode(encoded)
+        end = time.perf_counter()
+        print(f"{label}: encode {middle - start:.2f}s, decode {end - middle:.2f}s, {len(encoded) / 2 ** 20:.1f} MiB")
 
-# Write the modified byte array back to a file
-with open('image_modified.jpg', 'wb') as image_file:
-    image_file.write(img_data)
+benchmark_record_codec(size=10 ** 4)
+# benchmark_record_codec()  # Full run on 10^6 records
 # Byte arrays are especially useful for binary protocols, low-level data manipulation, or optimizing memory when dealing with large amounts of data.
 # Let me know if you'd like to explore any specific operation with byte arrays!
\ No newline at end of file
@@ -26,6 +26,163 @@ d = deque([1, 2, 3, 4])
 # o	Pop: d.pop()
 # o	Popleft: d.popleft()
 
+# Ring buffer for numeric samples
+# A deque stores every number as a separate Python object. RingBuffer keeps a fixed number of
+# samples in one preallocated array.array of a single typecode ('d' for floats, 'q' for ints, ...):
+# o	push_many() copies a whole array/buffer in with at most two memory copies (no per-item objects).
+#   Buffers of another item type are converted value by value; plain bytes are read as raw memory.
+# o	pop_many(n) returns up to n samples as a memoryview over a fresh array, again without boxing.
+# o	When it is full, overflow decides what happens: "drop_oldest" overwrites the oldest samples,
+#   "block" waits until a consumer makes room, "raise" raises BufferError.
+# All methods take a lock, so one thread can push while another pops.
+import threading
+
+class RingBuffer:
+    def __init__(self, capacity, typecode="d", overflow="drop_oldest"):
+        if overflow not in ("drop_oldest", "block", "raise"):
+            raise ValueError("overflow must be 'drop_oldest', 'block' or 'raise'")
+        self.capacity = capacity
+        self.typecode = typecode
+        self.overflow = overflow
+        self.data = array.array(typecode, bytes(array.array(typecode).itemsize * capacity))
+        self.view = memoryview(self.data)
+        self.start = 0  # Index of the oldest sample
+        self.size = 0
+        self.lock = threading.Lock()
+        self.space = threading.Condition(self.lock)  # Signalled when a pop frees room (for "block")
+
+    def __len__(self):
+        return self.size
+
+    def _as_array(self, values):
+        if isinstance(values, array.array) and values.typecode == self.typecode:
+            return values
+        result = array.array(self.typecode)
+        if isinstance(values, (bytes, bytearray)):
+            result.frombytes(values)  # Raw bytes, read as values of this buffer's typecode
+            return result
+        try:
+            view = memoryview(values)
+        except TypeError:
+            result.extend(values)  # Any other iterable of numbers
+            return result
+        if view.format in (self.typecode, "@" + self.typecode):
+            # Same item type: copy the memory as it is
+            result.frombytes(view.cast("B") if view.c_contiguous else view.tobytes())
+        else:
+            # Another item type (e.g. 'q' ints into a 'd' buffer): convert value by value,
+            # TypeError if they don't fit (floats into an int buffer)
+            result.extend(view.tolist())
+        return result
+
+    def _write(self, source):
+        # Copies source (which fits in the free space) after the newest sample
+        end = (self.start + self.size) % self.capacity
+        first = min(len(source), self.capacity - end)
+        self.view[end:end + first] = source[:first]
+        self.view[:len(source) - first] = source[first:]
+        self.size += len(source)
+
+    def push(self, value):
+        with self.lock:
+            if self.size == self.capacity:
+                if self.overflow == "raise":
+                    raise BufferError(f"ring buffer full: {self.size}/{self.capacity} used, 1 more pushed")
+                if self.overflow == "drop_oldest":
+                    self.start = (self.start + 1) % self.capacity
+                    self.size -= 1
+                else:
+                    while self.size == self.capacity:
+                        self.space.wait()
+            self.data[(self.start + self.size) % self.capacity] = value
+            self.size += 1
+
+    def push_many(self, values):
+        source = memoryview(self._as_array(values))
+        with self.lock:
+            if self.overflow == "raise" and len(source) > self.capacity - self.size:
+                raise BufferError(f"ring buffer full: {self.size}/{self.capacity} used, {len(source)} more pushed")
+            if self.overflow == "drop_oldest":
+                if len(source) >= self.capacity:
+                    source = source[len(source) - self.capacity:]
+                    self.start = self.size = 0
+                dropped = max(0, self.size + len(source) - self.capacity)
+                self.start = (self.start + dropped) % self.capacity
+                self.size -= dropped
+                self._write(source)
+            else:
+                while len(source):
+                    while self.size == self.capacity:
+                        self.space.wait()
+                    part = source[:self.capacity - self.size]
+                    self._write(part)
+                    source = source[len(part):]
+                return
+
+    def pop_many(self, n):
+        # Removes and returns up to n of the oldest samples as a memoryview
+        with self.lock:
+            n = min(n, self.size)
+            result = array.array(self.typecode, bytes(self.data.itemsize * n))
+            out = memoryview(result)
+            first = min(n, self.capacity - self.start)
+            out[:first] = self.view[self.start:self.start + first]
+            out[first:] = self.view[:n - first]
+            self.start = (self.start + n) % self.capacity
+            self.size -= n
+            if self.overflow == "block":
+                self.space.notify_all()
+            return out
+
+    def pop(self):
+        with self.lock:
+            if not self.size:
+                raise IndexError("pop from an empty ring buffer")
+            value = self.data[self.start]
+            self.start = (self.start + 1) % self.capacity
+            self.size -= 1
+            if self.overflow == "block":
+                self.space.notify_all()
+            return value
+
+samples = RingBuffer(4, "d")
+samples.push_many(array.array("d", [1.0, 2.0, 3.0, 4.0, 5.0]))  # 1.0 is dropped
+print(samples.pop_many(2).tolist())  # [2.0, 3.0]
+
+# Benchmark: RingBuffer against deque, one sample at a time and in batches
+import time
+
+def benchmark_ring_buffer(size=10 ** 6, batch=1000):
+    values = array.array("d", range(size))
+    ring = RingBuffer(10 * batch, "d")
+    queue = deque(maxlen=10 * batch)
+
+    start = time.perf_counter()
+    for value in values[:size // 10]:
+        ring.push(value)
+        ring.pop()
+    print(f"RingBuffer single: {(time.perf_counter() - start) / (size // 10) * 1e9:.0f} ns per push+pop")
+    start = time.perf_counter()
+    for value in values[:size // 10]:
+        queue.append(value)
+        queue.popleft()
+    print(f"deque single: {(time.perf_counter() - start) / (size // 10) * 1e9:.0f} ns per append+popleft")
+
+    view = memoryview(values)
+    start = time.perf_counter()
+    for i in range(0, size, batch):
+        ring.push_many(view[i:i + batch])
+        ring.pop_many(batch)
+    print(f"RingBuffer batch: {(time.perf_counter() - start) / size * 1e9:.1f} ns per sample")
+    start = time.perf_counter()
+    for i in range(0, size, batch):
+        queue.extend(view[i:i + batch])
+        [queue.popleft() for _ in range(batch)]
+    print(f"deque batch: {(time.perf_counter() - start) / size * 1e9:.1f} ns per sample")
+
+benchmark_ring_buffer(size=10 ** 5)
+# benchmark_ring_buffer()  # Full run on 10^6 samples
+
 # Namedtuples (from collections module)
 # •	Description: Immutable, tuple-like objects with named fields.
 # •	Syntax:
@@ -36,6 +193,159 @@ p = Point(10, 20)
 # o	Access by name: p.x
 # o	Access by index: p[0]
 
+# Compact records for millions of points
+# A namedtuple instance is a tuple (header + one pointer per field) and every float in it is another object.
+# o	record(name, fields) builds a mutable class with __slots__: no per-instance __dict__, attribute access by name.
+# o	PointArray stores all x values in one array('d') and all y values in another (struct of arrays):
+#   8 bytes per coordinate, no objects per point. points[i] returns a small PointView that reads and writes
+#   the columns in place, and points[a:b] is a zero-copy PointArray over memoryviews of the columns.
+#   (While such a slice is alive the parent array cannot grow; append() raises BufferError.)
+import keyword
+from itertools import chain
+
+def record(name, fields):
+    fields = tuple(fields.replace(",", " ").split()) if isinstance(fields, str) else tuple(map(str, fields))
+    # The names go into generated code, so check them the way namedtuple does
+    for field in (name,) + fields:
+        if not field.isidentifier() or keyword.iskeyword(field):
+            raise ValueError(f"record names must be identifiers and not keywords: {field!r}")
+    for field in fields:
+        if field.startswith("_"):
+            raise ValueError(f"field names cannot start with an underscore: {field!r}")
+    if len(set(fields)) != len(fields):
+        raise ValueError(f"duplicate field name in {fields!r}")
+    args = ", ".join(fields)
+    body = "".join(f"\n    self.{field} = {field}" for field in fields) or "\n    pass"
+    namespace = {}
+    exec(f"def __init__(self, {args}):{body}", namespace)
+
+    def __repr__(self):
+        return f"{name}(" + ", ".join(f"{field}={getattr(self, field)!r}" for field in fields) + ")"
+
+    def __iter__(self):
+        return (getattr(self, field) for field in fields)
+
+    def __eq__(self, other):
+        return type(other) is type(self) and tuple(self) == tuple(other)
+
+    return type(name, (), {
+        "__slots__": fields, "_fields": fields, "__init__": namespace["__init__"],
+        "__repr__": __repr__, "__iter__": __iter__, "__eq__": __eq__, "__hash__": None,
+    })
+
+PointRecord = record("PointRecord", "x y")
+
+class PointView:
+    __slots__ = ("points", "index")
+
+    def __init__(self, points, index):
+        self.points = points
+        self.index = index
+
+    @property
+    def x(self):
+        return self.points.xs[self.index]
+
+    @x.setter
+    def x(self, value):
+        self.points.xs[self.index] = value
+
+    @property
+    def y(self):
+        return self.points.ys[self.index]
+
+    @y.setter
+    def y(self, value):
+        self.points.ys[self.index] = value
+
+    def __iter__(self):
+        return iter((self.x, self.y))
+
+    def __repr__(self):
+        return f"PointView(x={self.x!r}, y={self.y!r})"
+
+class PointArray:
+    def __init__(self, xs=None, ys=None):
+        self.xs = array.array("d") if xs is None else xs
+        self.ys = array.array("d") if ys is None else ys
+        if len(self.xs) != len(self.ys):
+            raise ValueError("xs and ys must have the same length")
+
+    @classmethod
+    def from_iter(cls, points):
+        # One pass in C over the (x, y) pairs, then split the interleaved values with strided slices
+        flat = array.array("d", chain.from_iterable(points))
+        if len(flat) % 2:
+            raise ValueError("every point needs exactly two coordinates")
+        return cls(flat[0::2], flat[1::2])
+
+    def to_records(self, cls=PointRecord):
+        return list(map(cls, self.xs, self.ys))
+
+    def append(self, x, y):
+        self.xs.append(x)
+        self.ys.append(y)
+
+    def __len__(self):
+        return len(self.xs)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return PointArray(memoryview(self.xs)[index], memoryview(self.ys)[index])
+        if index < 0:
+            index += len(self.xs)
+        if not 0 <= index < len(self.xs):
+            raise IndexError("point index out of range")
+        return PointView(self, index)
+
+    def __iter__(self):
+        return zip(self.xs, self.ys)
+
+points = PointArray.from_iter([(10, 20), (30, 40), (50, 60)])
+points[1].x = 35.0
+print(points[1], points[1:].to_records())  # PointView(x=35.0, y=40.0) [PointRecord(x=35.0, y=40.0), PointRecord(x=50.0, y=60.0)]
+
+# Benchmark: memory and build/scan time for n points in each representation
+import tracemalloc
+from dataclasses import dataclass
+
+@dataclass(slots=True)
+class PointDataclass:
+    x: float
+    y: float
+
+def benchmark_point_storage(n=10 ** 6):
+    xs = [float(i) for i in range(n)]
+    ys = [float(i) * 0.5 for i in range(n)]
+    builders = {
+        "tuple": lambda: list(zip(xs, ys)),
+        "namedtuple": lambda: list(map(Point, xs, ys)),
+        "dataclass(slots=True)": lambda: list(map(PointDataclass, xs, ys)),
+        "record()": lambda: list(map(PointRecord, xs, ys)),
+        "PointArray": lambda: PointArray(array.array("d", xs), array.array("d", ys)),
+    }
+    for name, build in builders.items():
+        tracemalloc.start()
+        start = time.perf_counter()
+        built = build()
+        build_time = time.perf_counter() - start
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        start = time.perf_counter()
+        if name == "PointArray":
+            total = sum(built.xs)
+        elif name == "tuple":
+            total = sum(point[0] for point in built)
+        else:
+            total = sum(point.x for point in built)
+        scan_time = time.perf_counter() - start
+        # The float objects in xs/ys are shared by the object representations; PointArray copies them
+        print(f"{name}: {memory / n:.1f} bytes/point, build {build_time:.3f}s, sum(x) {scan_time:.3f}s")
+        del built
+
+benchmark_point_storage(n=10 ** 5)
+# benchmark_point_storage()  # Full run on 10^6 points
+
 # Defaultdicts (from collections module)
 # •	Description: Dictionaries with default values for non-existent keys.
 # •	Syntax:
@@ -46,6 +356,140 @@ dd['key'] += 1
 # o	Access: dd['key']
 # o	Add/Update: dd['key'] = 5
 
+# Counting from many threads
+# dd['key'] += 1 is a read followed by a write, so two threads can both read 5 and both write 6.
+# One global lock fixes that but makes every thread wait for it. ShardedCounter spreads keys over
+# several defaultdict shards, each with its own lock, and each thread first counts into its own buffer:
+# o	add(key) and update(keys) only touch the calling thread's buffer. Its lock is only ever contended
+#   while snapshot() drains it, so threads don't wait for each other.
+# o	After batch_size increments (or on flush()) the buffer is added to the shards, one lock per shard.
+# o	Every buffer is registered with the counter, so snapshot() drains all of them, including those of
+#   threads that have already finished, before merging the shards into one dict. No count is lost.
+from collections import Counter
+from itertools import islice
+
+class CountBuffer:
+    __slots__ = ("counts", "pending", "lock", "thread")
+
+    def __init__(self):
+        self.counts = Counter()
+        self.pending = 0  # Increments since the last flush
+        self.lock = threading.Lock()
+        self.thread = threading.current_thread()
+
+class ShardedCounter:
+    def __init__(self, shards=16, batch_size=8192):
+        self.shards = [defaultdict(int) for _ in range(shards)]
+        self.locks = [threading.Lock() for _ in range(shards)]
+        self.batch_size = batch_size
+        self.local = threading.local()
+        self.buffers = []  # Every thread's CountBuffer
+        self.buffers_lock = threading.Lock()
+
+    def _buffer(self):
+        try:
+            return self.local.buffer
+        except AttributeError:
+            buffer = self.local.buffer = CountBuffer()
+            with self.buffers_lock:
+                self.buffers.append(buffer)
+            return buffer
+
+    def add(self, key, amount=1):
+        buffer = self._buffer()
+        with buffer.lock:
+            buffer.counts[key] += amount
+            buffer.pending += 1
+            if buffer.pending >= self.batch_size:
+                self._flush(buffer)
+
+    def update(self, keys):
+        # Counts a batch of keys at a time with Counter.update, which loops in C
+        buffer, iterator = self._buffer(), iter(keys)
+        while chunk := list(islice(iterator, self.batch_size)):
+            with buffer.lock:
+                buffer.counts.update(chunk)
+                buffer.pending += len(chunk)
+                if buffer.pending >= self.batch_size:
+                    self._flush(buffer)
+
+    def _flush(self, buffer):
+        # The caller holds buffer.lock
+        batches = [[] for _ in self.shards]
+        for item in buffer.counts.items():
+            batches[hash(item[0]) % len(self.shards)].append(item)
+        for shard, lock, batch in zip(self.shards, self.locks, batches):
+            if batch:
+                with lock:
+                    for key, amount in batch:
+                        shard[key] += amount
+        buffer.counts.clear()
+        buffer.pending = 0
+
+    def flush(self):
+        buffer = self._buffer()
+        with buffer.lock:
+            self._flush(buffer)
+
+    def __getitem__(self, key):
+        # Counts still in thread buffers are not included; snapshot() drains them
+        index = hash(key) % len(self.shards)
+        with self.locks[index]:
+            return self.shards[index].get(key, 0)
+
+    def snapshot(self):
+        with self.buffers_lock:
+            buffers = self.buffers
+            # A finished thread can't add counts any more: drain its buffer once below and forget it
+            self.buffers = [buffer for buffer in buffers if buffer.thread.is_alive()]
+        for buffer in buffers:
+            with buffer.lock:
+                self._flush(buffer)
+        merged = {}
+        for shard, lock in zip(self.shards, self.locks):
+            with lock:
+                merged.update(shard)  # Every key lives in exactly one shard
+        return merged
+
+counts = ShardedCounter()
+counts.add('key')
+counts.add('key', 4)
+print(counts.snapshot())  # {'key': 5}
+
+# Benchmark: the same number of increments split over 1 to 16 threads, global lock vs ShardedCounter
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+def count_with_global_lock(shared, lock, keys):
+    for key in keys:
+        with lock:
+            shared[key] += 1
+
+def count_with_shards(counter, keys):
+    counter.update(keys)
+
+def benchmark_sharded_counter(increments=10 ** 6, distinct=10 ** 4):
+    rng = random.Random(3)
+    keys = [f"key{int(distinct * rng.random() ** 3)}" for _ in range(increments)]  # Few hot keys, long tail
+    for threads in (1, 2, 4, 8, 16):
+        parts = [keys[i::threads] for i in range(threads)]
+        shared, lock = defaultdict(int), threading.Lock()
+        start = time.perf_counter()
+        with ThreadPoolExecutor(threads) as pool:
+            list(pool.map(count_with_global_lock, [shared] * threads, [lock] * threads, parts))
+        locked_time = time.perf_counter() - start
+        counter = ShardedCounter()
+        start = time.perf_counter()
+        with ThreadPoolExecutor(threads) as pool:
+            list(pool.map(count_with_shards, [counter] * threads, parts))
+        sharded_time = time.perf_counter() - start
+        assert counter.snapshot() == shared
+        print(f"{threads:2} threads: global lock {increments / locked_time / 1e6:.2f}M/s, "
+              f"ShardedCounter {increments / sharded_time / 1e6:.2f}M/s")
+
+benchmark_sharded_counter(increments=10 ** 5)
+# benchmark_sharded_counter()  # Full run on 10^6 increments
+
 # Counter (from collections module)
 # •	Description: A dictionary subclass for counting hashable objects.
 # •	Syntax:
@@ -55,6 +499,227 @@ count = Counter(['a', 'b', 'c', 'a', 'b', 'b'])
 # o	Access counts: count['a']
 # o	Most common: count.most_common(2)
 
+# Top-k heavy hitters in fixed memory
+# Counter keeps one entry per distinct key, so on a stream with millions of distinct keys it grows without bound.
+# HeavyHitters answers most_common(k) approximately with a fixed amount of memory:
+# o	CountMinSketch: depth rows of width counters. Each key increments one counter per row; its estimate is the
+#   smallest of those counters. It never underestimates, and overestimates by at most epsilon * total with
+#   probability 1 - delta (width = e / epsilon, depth = ln(1 / delta)).
+# o	SpaceSaving: tracks at most capacity keys. A new key replaces the key with the smallest count and inherits that
+#   count as its error, so count - error <= true count <= count, and error <= total / capacity.
+# o	update() counts each batch with Counter first, so a repeated key costs one sketch update per batch.
+# o	merge() combines summaries built on different shards (same width, depth and seed for the sketches).
+import hashlib
+import heapq
+import math
+import random
+from itertools import count as counter_sequence, islice
+from operator import itemgetter
+
+MASK64 = (1 << 64) - 1
+
+def stable_hash64(key, seed=0):
+    # hash() of str/bytes changes between processes, which would make merging shards impossible
+    # Ints that fit in 64 bits are mixed directly (hash(-1) == hash(-2), so hash() would make them collide)
+    if type(key) is int and -(1 << 63) <= key < 1 << 63:
+        x = (key + seed * 0x9E3779B97F4A7C15) & MASK64  # splitmix64 finalizer
+        x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+        x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & MASK64
+        return x ^ (x >> 31)
+    data = key if isinstance(key, bytes) else key.encode() if isinstance(key, str) else repr(key).encode()
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8, salt=seed.to_bytes(8, "little")).digest(), "little")
+
+class CountMinSketch:
+    def __init__(self, width=2719, depth=5, seed=0):
+        self.width = width
+        self.depth = depth
+        self.seed = seed
+        self.table = array.array("q", bytes(8 * width * depth))
+        self.total = 0
+
+    @classmethod
+    def from_error(cls, epsilon=0.001, delta=0.01, seed=0):
+        return cls(math.ceil(math.e / epsilon), math.ceil(math.log(1 / delta)), seed)
+
+    @property
+    def epsilon(self):
+        return math.e / self.width
+
+    def _cells(self, key):
+        h = stable_hash64(key, self.seed)
+        h1, h2 = h & 0xFFFFFFFF, (h >> 32) | 1
+        width = self.width
+        return [row * width + (h1 + row * h2) % width for row in range(self.depth)]
+
+    def add(self, key, amount=1):
+        table = self.table
+        for cell in self._cells(key):
+            table[cell] += amount
+        self.total += amount
+
+    def update_counts(self, counts):
+        table, width, seed, rows = self.table, self.width, self.seed, range(self.depth)
+        for key, amount in counts.items():
+            h = stable_hash64(key, seed)
+            h1, h2 = h & 0xFFFFFFFF, (h >> 32) | 1
+            for row in rows:
+                table[row * width + (h1 + row * h2) % width] += amount
+            self.total += amount
+
+    def estimate(self, key):
+        table = self.table
+        return min(table[cell] for cell in self._cells(key))
+
+    def merge(self, other):
+        if (self.width, self.depth, self.seed) != (other.width, other.depth, other.seed):
+            raise ValueError("can only merge sketches with the same width, depth and seed")
+        table, other_table = self.table, other.table
+        for cell in range(len(table)):
+            table[cell] += other_table[cell]
+        self.total += other.total
+        return self
+
+class SpaceSaving:
+    def __init__(self, capacity=1000):
+        self.capacity = capacity
+        self.counts = {}
+        self.errors = {}
+        self.heap = []  # (count, sequence, key) entries; stale ones are skipped when popped
+        self.sequence = counter_sequence()
+        self.total = 0
+
+    def _push(self, key, count):
+        heapq.heappush(self.heap, (count, next(self.sequence), key))
+        if len(self.heap) > 4 * self.capacity:
+            self._rebuild_heap()
+
+    def _rebuild_heap(self):
+        self.heap = [(count, next(self.sequence), key) for key, count in self.counts.items()]
+        heapq.heapify(self.heap)
+
+    def _pop_min(self):
+        heap, counts = self.heap, self.counts
+        while True:
+            count, _, key = heapq.heappop(heap)
+            if counts.get(key) == count:
+                return key, count
+
+    def update_counts(self, counts):
+        tracked, errors = self.counts, self.errors
+        for key, amount in counts.items():
+            self.total += amount
+            if key in tracked:
+                tracked[key] += amount
+            elif len(tracked) < self.capacity:
+                tracked[key] = amount
+                errors[key] = 0
+            else:
+                evicted, smallest = self._pop_min()
+                del tracked[evicted], errors[evicted]
+                tracked[key] = smallest + amount
+                errors[key] = smallest
+            self._push(key, tracked[key])
+
+    def min_count(self):
+        # Any key that is not tracked occurred at most this many times
+        if len(self.counts) < self.capacity:
+            return 0
+        key, count = self._pop_min()
+        self._push(key, count)
+        return count
+
+    def most_common(self, k=None):
+        # (key, count, error) with count - error <= true count <= count
+        items = self.counts.items()
+        top = sorted(items, key=itemgetter(1), reverse=True) if k is None else heapq.nlargest(k, items, key=itemgetter(1))
+        return [(key, count, self.errors[key]) for key, count in top]
+
+    def merge(self, other):
+        # Keys missing from a full summary may still have occurred up to its smallest count there
+        own_min, other_min = self.min_count(), other.min_count()
+        counts, errors = {}, {}
+        for key in self.counts.keys() | other.counts.keys():
+            counts[key] = self.counts.get(key, own_min) + other.counts.get(key, other_min)
+            errors[key] = (self.errors[key] if key in self.counts else own_min) + \
+                          (other.errors[key] if key in other.counts else other_min)
+        kept = heapq.nlargest(self.capacity, counts, key=counts.__getitem__)
+        self.counts = {key: counts[key] for key in kept}
+        self.errors = {key: errors[key] for key in kept}
+        self.total += other.total
+        self._rebuild_heap()
+        return self
+
+class HeavyHitters:
+    def __init__(self, capacity=1000, epsilon=0.001, delta=0.01, seed=0, batch_size=65536):
+        self.sketch = CountMinSketch.from_error(epsilon, delta, seed)
+        self.tracker = SpaceSaving(capacity)
+        self.batch_size = batch_size
+
+    @property
+    def total(self):
+        return self.tracker.total
+
+    def update(self, iterable):
+        iterator = iter(iterable)
+        while batch := Counter(islice(iterator, self.batch_size)):
+            self.sketch.update_counts(batch)
+            self.tracker.update_counts(batch)
+        return self
+
+    def most_common(self, k=None):
+        # (key, estimate, lower_bound): the true count lies in [lower_bound, estimate]
+        result = []
+        for key, count, error in self.tracker.most_common():
+            result.append((key, min(count, self.sketch.estimate(key)), count - error))
+        result.sort(key=itemgetter(1), reverse=True)
+        return result if k is None else result[:k]
+
+    def merge(self, other):
+        self.sketch.merge(other.sketch)
+        self.tracker.merge(other.tracker)
+        return self
+
+hitters = HeavyHitters(capacity=100).update(['a', 'b', 'c', 'a', 'b', 'b'])
+print(hitters.most_common(2))  # [('b', 3, 3), ('a', 2, 2)]
+
+# Benchmark: HeavyHitters against Counter on a stream where most keys occur once
+def zipf_stream(distinct, heavy=20, seed=1):
+    # distinct keys that occur once, plus one heavy-key event after every 3rd of them
+    # (heavy key -h occurs about distinct / (3 * (h - 1)) times)
+    rng = random.Random(seed)
+    for i in range(distinct):
+        yield i
+        if i % 3 == 0:
+            yield -1 - int(1 / (rng.random() + 1 / heavy))
+
+def measure(build):
+    # Time an untraced run, then build again under tracemalloc to see how much memory the result holds
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    del result
+    tracemalloc.start()
+    result = build()
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, elapsed, memory
+
+def benchmark_heavy_hitters(distinct=10 ** 7, k=10):
+    exact, counter_time, counter_memory = measure(lambda: Counter(zipf_stream(distinct)))
+    top = exact.most_common(k)
+    del exact
+    hitters, sketch_time, sketch_memory = measure(lambda: HeavyHitters(capacity=1000).update(zipf_stream(distinct)))
+    approx = hitters.most_common(k)
+
+    print(f"Counter: {counter_time:.2f}s, {counter_memory / 2 ** 20:.1f} MiB")
+    print(f"HeavyHitters: {sketch_time:.2f}s, {sketch_memory / 2 ** 20:.1f} MiB, "
+          f"same top-{k} keys: {[key for key, _ in top] == [key for key, _, _ in approx]}")
+    for (key, true_count), (_, estimate, lower) in zip(top, approx):
+        print(f"  {key}: true {true_count}, bounds [{lower}, {estimate}]")
+
+benchmark_heavy_hitters(distinct=10 ** 4, k=3)
+# benchmark_heavy_hitters()  # Full run on 10^7 distinct keys (~1.33 * 10^7 events)
+
 # OrderedDicts (from collections module)
 # •	Description: Dictionaries that remember the order in which items were inserted.
 # •	Syntax:
@@ -66,4 +731,227 @@ od['b'] = 2
 # o	Access: od['a']
 # o	Add/Update: od['c'] = 3
 
+# LRU and LFU caches
+# LRUCache keeps entries in an OrderedDict: a hit moves the key to the end (move_to_end) and eviction removes the
+# least recently used key from the front (popitem(last=False)), both O(1).
+# LFUCache evicts the least frequently used key instead. It keeps one OrderedDict bucket per use count plus the
+# smallest count in use, so a hit moves a key to the next bucket and eviction takes the oldest key of the smallest
+# bucket, also O(1).
+# Both support:
+# o	max_items and max_bytes limits; sizes come from sizeof (sys.getsizeof by default, pass your own for nested values).
+# o	ttl in seconds for every entry (or per put()); expired entries are dropped when read or by expire().
+# o	on_evict(key, value, reason) with reason "capacity", "expired" or "too_large" (a value bigger than max_bytes).
+# o	stats() for dashboards: hits, misses, evictions, expirations, items, bytes.
+import sys
+
+CacheStats = namedtuple("CacheStats", ["hits", "misses", "evictions", "expirations", "items", "bytes"])
+MISSING = object()
+
+class LRUCache:
+    def __init__(self, max_items=None, max_bytes=None, ttl=None, sizeof=sys.getsizeof, on_evict=None,
+                 clock=time.monotonic):
+        if max_items is not None and max_items < 1:
+            raise ValueError("max_items must be at least 1")
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.sizeof = sizeof
+        self.on_evict = on_evict
+        self.clock = clock
+        self.entries = OrderedDict()  # key -> [value, size, expires]
+        self.bytes = 0
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+    # Ordering hooks; LFUCache replaces these four
+    def _insert(self, key, entry):
+        self.entries[key] = entry
+
+    def _touch(self, key):
+        self.entries.move_to_end(key)
+
+    def _remove(self, key):
+        return self.entries.pop(key)
+
+    def _pop_victim(self, keep=None):
+        # keep was just used, so it is at the end and never the least recently used
+        return self.entries.popitem(last=False)
+
+    def _expired(self, entry):
+        return entry[2] is not None and entry[2] <= self.clock()
+
+    def _discard(self, key, reason):
+        entry = self._remove(key)
+        self.bytes -= entry[1]
+        if reason == "expired":
+            self.expirations += 1
+        if self.on_evict:
+            self.on_evict(key, entry[0], reason)
+
+    def get(self, key, default=None):
+        entry = self.entries.get(key)
+        if entry is not None and self._expired(entry):
+            self._discard(key, "expired")
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._touch(key)
+        return entry[0]
+
+    def __getitem__(self, key):
+        value = self.get(key, MISSING)
+        if value is MISSING:
+            raise KeyError(key)
+        return value
+
+    def put(self, key, value, ttl=None):
+        size = self.sizeof(value) if self.max_bytes is not None else 0
+        ttl = self.ttl if ttl is None else ttl
+        expires = None if ttl is None else self.clock() + ttl
+        if self.max_bytes is not None and size > self.max_bytes:
+            # Storing it would evict everything else and still not fit
+            self.pop(key, None)
+            self.evictions += 1
+            if self.on_evict:
+                self.on_evict(key, value, "too_large")
+            return
+        entry = self.entries.get(key)
+        if entry is None:
+            # Make room first: evicting afterwards could pick the new key itself (it has the fewest uses in LFU)
+            self._make_room(1, size)
+            self._insert(key, [value, size, expires])
+            self.bytes += size
+        else:
+            self.bytes += size - entry[1]
+            entry[0], entry[1], entry[2] = value, size, expires
+            self._touch(key)
+            self._make_room(0, 0, keep=key)
+
+    def _make_room(self, items, size, keep=None):
+        # Evicts until items more entries of size more bytes fit, never evicting keep
+        while (self.max_items is not None and len(self.entries) + items > self.max_items) or \
+                (self.max_bytes is not None and self.bytes + size > self.max_bytes):
+            evicted, entry = self._pop_victim(keep)
+            self.bytes -= entry[1]
+            self.evictions += 1
+            if self.on_evict:
+                self.on_evict(evicted, entry[0], "capacity")
+
+    __setitem__ = put
+
+    def pop(self, key, default=MISSING):
+        if key in self.entries:
+            entry = self._remove(key)
+            self.bytes -= entry[1]
+            return entry[0]
+        if default is MISSING:
+            raise KeyError(key)
+        return default
+
+    def __delitem__(self, key):
+        self.pop(key)
+
+    def __contains__(self, key):
+        entry = self.entries.get(key)
+        return entry is not None and not self._expired(entry)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def expire(self):
+        # Drops every expired entry now instead of waiting for it to be read
+        now = self.clock()
+        expired = [key for key, entry in self.entries.items() if entry[2] is not None and entry[2] <= now]
+        for key in expired:
+            self._discard(key, "expired")
+        return len(expired)
+
+    def clear(self):
+        for key in list(self.entries):
+            self.pop(key)
+
+    def stats(self):
+        return CacheStats(self.hits, self.misses, self.evictions, self.expirations, len(self.entries), self.bytes)
+
+class LFUCache(LRUCache):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.entries = {}  # key -> [value, size, expires, uses]
+        self.buckets = defaultdict(OrderedDict)  # uses -> keys with that many uses, oldest first
+        self.min_uses = 0
+
+    def _insert(self, key, entry):
+        entry.append(1)
+        self.entries[key] = entry
+        self.buckets[1][key] = None
+        self.min_uses = 1
+
+    def _unlink(self, key, uses):
+        # Returns True when this emptied the smallest bucket
+        bucket = self.buckets[uses]
+        del bucket[key]
+        if bucket:
+            return False
+        del self.buckets[uses]
+        return uses == self.min_uses
+
+    def _touch(self, key):
+        entry = self.entries[key]
+        uses = entry[3]
+        entry[3] = uses + 1
+        self.buckets[uses + 1][key] = None
+        if self._unlink(key, uses):
+            self.min_uses = uses + 1
+
+    def _remove(self, key):
+        entry = self.entries.pop(key)
+        if self._unlink(key, entry[3]):
+            self.min_uses = 0  # Found again by the next _pop_victim()
+        return entry
+
+    def _pop_victim(self, keep=None):
+        if self.min_uses not in self.buckets:
+            self.min_uses = min(self.buckets)
+        for key in self.buckets[self.min_uses]:
+            if key != keep:
+                return key, self._remove(key)
+        # keep is the only key with the fewest uses: take the oldest key of the next bucket
+        key = next(iter(self.buckets[min(uses for uses in self.buckets if uses != self.min_uses)]))
+        return key, self._remove(key)
+
+cache = LRUCache(max_items=2)
+cache['a'] = 1
+cache['b'] = 2
+cache.get('a')
+cache['c'] = 3  # Evicts 'b', the least recently used
+print(list(cache.entries), cache.stats())
+
+frequent = LFUCache(max_items=2)
+frequent['a'] = 1
+frequent['b'] = 2
+frequent.get('a')
+frequent.get('b')
+frequent['c'] = 3  # Evicts 'a' (2 uses, older than 'b'); the new key itself is kept
+assert 'c' in frequent, "a new key must survive its own put"
+print(list(frequent.entries))  # ['b', 'c']
+
+# Benchmark: hit rate and cost per request of LRU and LFU on a skewed workload with periodic scans
+def benchmark_caches(requests=10 ** 6, capacity=1000):
+    rng = random.Random(2)
+    workload = [f"scan{i}" if i % 10 == 0 else f"key{int(capacity * 10 * rng.random() ** 3)}" for i in range(requests)]
+    for cache_class in (LRUCache, LFUCache):
+        cache = cache_class(max_items=capacity)
+        start = time.perf_counter()
+        for key in workload:
+            if cache.get(key) is None:
+                cache.put(key, key)
+        elapsed = time.perf_counter() - start
+        stats = cache.stats()
+        print(f"{cache_class.__name__}: hit rate {stats.hits / requests:.1%}, "
+              f"{elapsed / requests * 1e9:.0f} ns per request, {stats.evictions} evictions")
+
+benchmark_caches(requests=10 ** 5)
+# benchmark_caches()  # Full run on 10^6 requests
+
 # These data structures provide a wide range of functionalities to handle various programming tasks efficiently.
\ No newline at end of file